@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import os
 from abc import ABC
+from functools import lru_cache
 from typing import List, Literal, Dict, Any, cast, Tuple
+from weakref import WeakKeyDictionary
 
 from google.auth.transport.requests import Request  # type: ignore
 from google.auth.exceptions import RefreshError  # type: ignore
 from google.oauth2.credentials import Credentials  # type: ignore
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import Resource, build
+from googleapiclient.discovery import Resource, build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .interfaces import AuthConfig
 from . import _google_terms as terms
@@ -18,6 +27,75 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
 ]
 
+# The order range properties appear in within range keys, so that equivalent ranges
+# produce the same key regardless of their dictionary order:
+_RANGE_KEY_ORDER = (
+    terms.TAB_ID,
+    terms.STARTROW,
+    terms.ENDROW,
+    terms.STARTCOL,
+    terms.ENDCOL,
+    terms.STARTIDX,
+    terms.ENDIDX,
+)
+
+# Credentials obtained for each AuthConfig, so that Connections sharing an AuthConfig
+# (e.g. the Drive and Sheets connections of a Drive) only authenticate once:
+_AUTH_CACHE: WeakKeyDictionary[AuthConfig, Credentials] = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=None)
+def _load_discovery_doc(api: str, version: str) -> str | None:
+    # googleapiclient re-reads the bundled discovery document from disk every time
+    # build() is called. Only the raw json is cached: build_from_document parses
+    # it into a fresh dict per Connection, since building a Resource can modify
+    # the parsed document.
+    return get_static_doc(api, version)
+
+
+def _split_fields(mask: str) -> List[str]:
+    # Splits a field mask into its top-level fields, e.g. "a,b(c(d),e)" -> "a",
+    # "b(c(d),e)". Commas are only separators outside of parentheses:
+    fields: List[str] = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(mask):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            fields.append(mask[start:i])
+            start = i + 1
+    fields.append(mask[start:])
+    return [f.strip() for f in fields if f.strip()]
+
+
+class _FastJsonModel(JsonModel):
+    """
+    JsonModel that encodes api requests and decodes api responses with orjson,
+    which is considerably faster than the standard library on large Sheets
+    payloads. Only used when orjson is installed.
+    """
+
+    def serialize(self, body_value: Any) -> str:
+        if self._data_wrapper:
+            # Rare enough that it's not worth duplicating the wrapping logic.
+            return super().serialize(body_value)
+        try:
+            # Decoded because batched http requests expect a str body.
+            return orjson.dumps(body_value).decode()
+        except orjson.JSONEncodeError:
+            return super().serialize(body_value)
+
+    def deserialize(self, content: bytes | str) -> Any:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN, non-json bodies, etc), so defer
+            # to the default behavior when it can't handle the content.
+            return super().deserialize(content)
+
 
 class Connection(ABC):
     """
@@ -133,7 +211,9 @@ class Connection(ABC):
         self, scopes: List[str], api: Literal["drive", "sheets"], version: str
     ) -> Resource:
         """
-        Generates a connection to the specified Google api.
+        Generates a connection to the specified Google api. Credentials are only
+        generated the first time an AuthConfig is used to connect, subsequent
+        Connections with the same AuthConfig will reuse them.
 
         Args:
           scopes (List[str]): A list of scopes dictating the limits of the
@@ -147,11 +227,18 @@ class Connection(ABC):
           to the appropriate Google api.
 
         """
-        creds = self._authenticate(
-            scopes,
-            self._auth_config,
-        )
-        return build(api, version, credentials=creds)
+        creds = _AUTH_CACHE.get(self._auth_config)
+        if creds is None:
+            creds = self._authenticate(
+                scopes,
+                self._auth_config,
+            )
+            _AUTH_CACHE[self._auth_config] = creds
+        model = _FastJsonModel() if orjson else None
+        doc = _load_discovery_doc(api, version)
+        if doc is None:
+            return build(api, version, credentials=creds, model=model)
+        return build_from_document(doc, credentials=creds, model=model)
 
     @staticmethod
     def get_creds_from_env() -> Credentials | None:
@@ -201,22 +288,18 @@ class Connection(ABC):
             result[k] = final_val
         return result
 
+    @staticmethod
+    def _merge_fields(fields1: str | None, fields2: str | None) -> str | None:
+        if not fields1 or not fields2:
+            return fields1 or fields2
+        if "*" in (fields1, fields2):
+            return "*"
+        fields = dict.fromkeys(_split_fields(f"{fields1},{fields2}"))
+        return ",".join(fields)
+
     @staticmethod
     def _create_range_tuple_key(input: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
-        key_order = (
-            terms.TAB_ID,
-            terms.STARTROW,
-            terms.ENDROW,
-            terms.STARTCOL,
-            terms.ENDCOL,
-            terms.STARTIDX,
-            terms.ENDIDX,
-        )
-        result: List[Tuple[str, Any]] = []
-        for key in key_order:
-            if key in input.keys():
-                result.append((key, input[key]))
-        return tuple(result)
+        return tuple([(k, input[k]) for k in _RANGE_KEY_ORDER if k in input])
 
     @classmethod
     def _preprocess_requests(
@@ -228,23 +311,30 @@ class Connection(ABC):
         result: List[Dict[str, Any]] = []
         for request in requests:
             range_key = None
-            for request_type in request.keys():
-                if terms.RNG in request[request_type].keys():
-                    range_key = cls._create_range_tuple_key(
-                        request[request_type][terms.RNG]
-                    )
+            for request_type, request_body in request.items():
+                rng = request_body.get(terms.RNG)
+                if rng is not None:
+                    range_key = cls._create_range_tuple_key(rng)
                 if range_key:
-                    if request_type not in ranged_requests.keys():
-                        ranged_requests[request_type] = {}
-                    if range_key in ranged_requests[request_type].keys():
-                        existing_dict = ranged_requests[request_type][range_key]
-                    else:
-                        existing_dict = {}
-                    ranged_requests[request_type][range_key] = cls._merge_dicts(
-                        existing_dict, request
+                    type_requests = ranged_requests.setdefault(request_type, {})
+                    existing = type_requests.get(range_key)
+                    if existing is None:
+                        # Nothing to merge with yet, and _merge_dicts never mutates
+                        # its inputs, so the request can be kept as-is:
+                        type_requests[range_key] = request
+                        continue
+                    merged = cls._merge_dicts(existing, request)
+                    # Each request's field mask only covers its own updates, so
+                    # the merged request needs all of them:
+                    fields = cls._merge_fields(
+                        existing[request_type].get(terms.FIELDS),
+                        request_body.get(terms.FIELDS),
                     )
+                    if fields:
+                        merged[request_type][terms.FIELDS] = fields
+                    type_requests[range_key] = merged
                 else:
                     result.append(request)
         for range_dict in ranged_requests.values():
-            result += list(range_dict.values())
+            result.extend(range_dict.values())
         return {"requests": result}
@@ -2,9 +2,19 @@ from .interfaces import AuthConfig as AuthConfig
 from abc import ABC
 from google.oauth2.credentials import Credentials  # type: ignore
 from googleapiclient.discovery import Resource
+from googleapiclient.model import JsonModel
 from typing import Any, Dict, List, Literal, Tuple, Union
 
 SCOPES: Any
+_RANGE_KEY_ORDER: Any
+_AUTH_CACHE: Any
+
+def _split_fields(mask: str) -> List[str]: ...
+def _load_discovery_doc(api: str, version: str) -> Union[str, None]: ...
+
+class _FastJsonModel(JsonModel):
+    def serialize(self, body_value: Any) -> str: ...
+    def deserialize(self, content: Union[bytes, str]) -> Any: ...
 
 class Connection(ABC):
     google_obj_types: Any = ...
@@ -33,6 +43,10 @@ class Connection(ABC):
         cls: Any, dict1: Dict[str, Any], dict2: Dict[str, Any]
     ) -> Dict[str, Any]: ...
     @staticmethod
+    def _merge_fields(
+        fields1: Union[str, None], fields2: Union[str, None]
+    ) -> Union[str, None]: ...
+    @staticmethod
     def _create_range_tuple_key(
         input: Dict[str, Any]
     ) -> Tuple[Tuple[str, Any], ...]: ...
@@ -26,6 +26,8 @@ ROWDATA = "rowData"
 VALUES = "values"
 # Requests:
 ADDTAB = "addSheet"
+REPLIES = "replies"
+UPDATED_SHEET = "updatedSpreadsheet"
 RPT_CELL = "repeatCell"
 # Update cell property names:
 ROWS = "rows"
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import string
 from abc import ABC
 from typing import Any, Dict, Generic, List, Tuple, Type, TypeVar, Sequence
 from pathlib import Path
@@ -10,7 +9,7 @@ import jsonlines  # type: ignore
 from . import _google_terms as terms
 from .connection import SheetsConnection
 from .dtypes import (
-    GOOGLE_DTYPES,
+    KEY_MAP,
     TYPE_MAP,
     EffectiveFmt,
     EffectiveVal,
@@ -119,6 +118,8 @@ class GSheetView(ABC):
     Abstract base class for the different ways of viewing a Google Sheet.
     """
 
+    __slots__ = ("_conn", "_auth", "_gsheet_id", "_requests")
+
     def __init__(
         self,
         gsheet_id: str,
@@ -260,25 +261,47 @@ class GSheetView(ABC):
             information.
 
         """
+        # Resolve everything that doesn't vary by cell once, up front:
+        value_key = str(value_type)
+        fmt_key = str(EffectiveFmt)
+        values_key = terms.VALUES
+        if not value_type.has_dtype:
+            # Untyped values (e.g. FormattedVal) are taken as-is, so plain
+            # comprehensions beat the general loop below:
+            return (
+                [[c.get(value_key) for c in r.get(values_key, ())] for r in row_data],
+                [[c.get(fmt_key, {}) for c in r.get(values_key, ())] for r in row_data],
+            )
         values: List[List[Any]] = []
         formats: List[List[Dict[str, Any]]] = []
+        parse_value = value_type == UserEnteredVal  # type: ignore
+        # Bound locally since they're looked up for every cell:
+        get_dtype = KEY_MAP.get
         for row in row_data:
+            cells = row.get(values_key, ())
+            if not any(cells):
+                # Rows of empty cells ({}) are common in sparse sheets:
+                values.append([None] * len(cells))
+                formats.append([{} for _ in cells])
+                continue
             value_list: List[Any] = []
             fmt_list: List[Dict[str, Any]] = []
-            for cell in row.get(terms.VALUES, []):
-                raw_value = cell.get(str(value_type))
-                fmt = cell.get(str(EffectiveFmt), {})
-                value = raw_value
-                if value_type in (UserEnteredVal, EffectiveVal):
-                    if raw_value:
-                        for dtype in GOOGLE_DTYPES:
-                            value = raw_value.get(str(dtype))
-                            if value:
-                                if value_type == UserEnteredVal:  # type: ignore
-                                    value = dtype.parse(value)
-                                break
-                value_list.append(value)
-                fmt_list.append(fmt)
+            append_value = value_list.append
+            append_fmt = fmt_list.append
+            for cell in cells:
+                get = cell.get
+                value = get(value_key)
+                if value:
+                    # Typed values are a single dtype key -> value pair:
+                    ((dtype_key, value),) = value.items()
+                    dtype = get_dtype(dtype_key)
+                    if dtype is None:
+                        # Error values and other non-data types:
+                        value = None
+                    elif parse_value and isinstance(value, str):
+                        value = dtype.parse(value)
+                append_value(value)
+                append_fmt(get(fmt_key, {}))
             values.append(value_list)
             formats.append(fmt_list)
         return values, formats
@@ -304,10 +327,42 @@ class GSheetView(ABC):
             a list of data values and another list of formatting information.
 
         """
-        raw = self.conn.get_data(gsheet_id, [rng_str])
+        raw = self.conn.get_data(gsheet_id, [rng_str], value_type=value_type)
         row_data = raw[terms.TABS_PROP][0][terms.DATA][0].get(terms.ROWDATA, [])
         return self._parse_row_data(row_data, value_type=value_type)
 
+    def _commit_and_get_data(
+        self,
+        rng_str: str,
+        value_type: GoogleValueType = EffectiveVal,
+    ) -> Tuple[List[List[Any]], List[List[Dict[str, Any]]]]:
+        """
+        Commits the amassed requests on this view and has the Sheets api return
+        the data in the specified range in the same response, then parses it.
+
+        Args:
+            rng_str (str: str): The range within the Google Sheet to fetch data from.
+            value_type (GoogleValueType, optional): The value representation to
+                extract from the raw data, defaults to EffectiveVal
+
+        Returns:
+            Tuple[List[List[Any]], List[List[Dict[str, Any]]]]: A tuple containing
+            a list of data values and another list of formatting information.
+
+        Raises:
+            NoConnectionError: If the view's SheetsConnection is null.
+
+        """
+        if not self._conn:
+            raise NoConnectionError(type(self))
+        raw = self._conn.execute_requests_and_get_data(
+            self._gsheet_id, self._requests, [rng_str], value_type
+        )
+        self._requests = []
+        tab = raw[terms.UPDATED_SHEET][terms.TABS_PROP][0]
+        row_data = tab[terms.DATA][0].get(terms.ROWDATA, [])
+        return self._parse_row_data(row_data, value_type=value_type)
+
     def _write_values(
         self: T,
         data: Sequence[Sequence[Any] | Dict[str, Any]],
@@ -320,6 +375,8 @@ class GSheetView(ABC):
 
         Args:
             data (Sequence[Sequence[Any] | Dict[str, Any]]): The data to write.
+                Array-likes with a tolist method (e.g. numpy arrays) are
+                converted to nested lists of python values first.
             rng_dict (Dict[str, int]): The range properties to write to. Defaults
                 to None, in which case the values will be appended after the last
                 populated row of the sheet.
@@ -328,31 +385,36 @@ class GSheetView(ABC):
             T: This View object.
 
         """
-        write_values: List[List[Dict[str, Any]]] = []
+        if hasattr(data, "tolist"):
+            # Unboxes numpy scalars in one C-level pass, and ensures they're
+            # dispatched on python types by _gen_cell_write_value:
+            data = data.tolist()  # type: ignore
+        gen_value = self._gen_cell_write_value
+        values_key = terms.VALUES
+        rows: List[Dict[str, List[Dict[str, Any]]]] = []
         for row in data:
             if isinstance(row, dict):
-                if len(write_values) == 0:
-                    write_values.append(
-                        [self._gen_cell_write_value(k) for k in row.keys()]
-                    )
-                std_row = [val for val in row.values()]
-            else:
-                std_row = [val for val in row]
-            write_values.append([self._gen_cell_write_value(val) for val in std_row])
-        target: Dict[str, Dict[str, int]] | Dict[str, int]
+                if not rows:
+                    rows.append({values_key: [gen_value(k) for k in row]})
+                row = row.values()
+            rows.append({values_key: [gen_value(val) for val in row]})
+        request: Dict[str, Any]
         if rng_dict is not None:
-            target = {terms.RNG: {terms.TAB_ID: tab_id, **rng_dict}}
-            req_type = "updateCells"
+            request = {
+                "updateCells": {
+                    terms.FIELDS: "*",
+                    terms.ROWS: rows,
+                    terms.RNG: {terms.TAB_ID: tab_id, **rng_dict},
+                }
+            }
         else:
-            target = {terms.TAB_ID: tab_id}
-            req_type = "appendCells"
-        request = {
-            req_type: {
-                terms.FIELDS: "*",
-                terms.ROWS: [{terms.VALUES: values} for values in write_values],
-                **target,
+            request = {
+                "appendCells": {
+                    terms.FIELDS: "*",
+                    terms.ROWS: rows,
+                    terms.TAB_ID: tab_id,
+                }
             }
-        }
         self._requests.append(request)
         return self
 
@@ -396,18 +458,10 @@ class GSheetView(ABC):
 
         Returns:
             List[str]: A list containing as many letters and letter combos as
-            desired. Can be used to generate sets up to 676 in length.
+            desired.
 
         """
-        a = string.ascii_uppercase
-        result: List[str] = list()
-        x = num // 26
-        for i in range(x + 1):
-            root = a[i - 1] if i > 0 else ""
-            keys = [root + a[j] for j in range(26)]
-            for k in keys:
-                result.append(k) if len(result) < num else None
-        return result
+        return [FullRange._convert_col_idx_to_alpha(i) for i in range(num)]
 
 
 class Component(GSheetView, Generic[FC, FG, FT]):
@@ -415,6 +469,16 @@ class Component(GSheetView, Generic[FC, FG, FT]):
     Base class for Tab and Range.
     """
 
+    __slots__ = (
+        "_rng",
+        "_tab_id",
+        "_values",
+        "_formats",
+        "_format_cell",
+        "_format_grid",
+        "_format_text",
+    )
+
     def __init__(
         self,
         *,
@@ -4,8 +4,8 @@ from .dtypes import (
     EffectiveFmt as EffectiveFmt,
     EffectiveVal as EffectiveVal,
     Formula as Formula,
-    GOOGLE_DTYPES as GOOGLE_DTYPES,
     GoogleValueType as GoogleValueType,
+    KEY_MAP as KEY_MAP,
     String as String,
     TYPE_MAP as TYPE_MAP,
     UserEnteredVal as UserEnteredVal,
@@ -75,6 +75,9 @@ class GSheetView(ABC):
     def _get_data(
         self, gsheet_id: str, rng_str: str, value_type: GoogleValueType = ...
     ) -> Tuple[List[List[Any]], List[List[Dict[str, Any]]]]: ...
+    def _commit_and_get_data(
+        self, rng_str: str, value_type: GoogleValueType = ...
+    ) -> Tuple[List[List[Any]], List[List[Dict[str, Any]]]]: ...
     def _write_values(
         self: T,
         data: Sequence[Union[Sequence[Any], Dict[str, Any]]],
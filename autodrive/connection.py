@@ -1,18 +1,64 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, Iterator, List, Literal, Tuple
 from pathlib import Path
 import mimetypes
+from contextlib import contextmanager
+from functools import lru_cache
 from warnings import warn
 
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 
 from . import _google_terms as terms
 from ._conn import Connection
-from .dtypes import EffectiveFmt, EffectiveVal, FormattedVal, UserEnteredVal
+from .dtypes import (
+    EffectiveFmt,
+    EffectiveVal,
+    FormattedVal,
+    GoogleValueType,
+    UserEnteredVal,
+)
 from .interfaces import AuthConfig
 
 
+def _gen_properties_fields() -> str:
+    gsheet_props = f"{terms.FILE_PROPS}({terms.FILE_NAME})"
+    grid_props = f"{terms.GRID_PROPS}({terms.COL_CT},{terms.ROW_CT})"
+    tab_props = f"{terms.TAB_IDX},{terms.TAB_ID},{terms.TAB_NAME},{grid_props}"
+    tabs_prop = f"{terms.TABS_PROP}({terms.TAB_PROPS}({tab_props}))"
+    return f"{gsheet_props},{tabs_prop}"
+
+
+# The data field masks only vary by these arguments, so each is only assembled once:
+@lru_cache(maxsize=None)
+def _gen_data_fields(
+    value_type: GoogleValueType | None = None, with_tab_titles: bool = False
+) -> str:
+    if value_type is None:
+        data_values = f"{UserEnteredVal},{FormattedVal},{EffectiveVal}"
+    else:
+        data_values = f"{value_type}"
+    formatting_values = f"{EffectiveFmt}"
+    values = f"{terms.VALUES}({data_values},{formatting_values})"
+    tab_fields = f"{terms.DATA}({terms.ROWDATA}({values}))"
+    if with_tab_titles:
+        tab_fields = f"{terms.TAB_PROPS}({terms.TAB_NAME}),{tab_fields}"
+    return f"{terms.TABS_PROP}({tab_fields})"
+
+
+@lru_cache(maxsize=None)
+def _gen_update_data_fields(value_type: GoogleValueType | None = None) -> str:
+    data_fields = _gen_data_fields(value_type)
+    return f"{terms.REPLIES},{terms.UPDATED_SHEET}({data_fields})"
+
+
+# The properties field mask never changes, so it's only assembled once:
+_PROPERTIES_FIELDS = _gen_properties_fields()
+# The most calls the Drive api will accept in a single batch request:
+_MAX_BATCH_SIZE = 100
+
+
 class FileUpload:
     """
     Use FileUploads when you need more complicated file upload instructions.
@@ -120,12 +166,85 @@ class DriveConnection(Connection):
             List[Dict[str, Any]]: A list of object properties, if any matches are
             found.
 
+        """
+        query = self._gen_find_query(obj_name, obj_type)
+        return self._list_objects(query, shared_drive_id)
+
+    def find_objects(
+        self,
+        *queries: Tuple[str, Literal["sheet", "folder", "file"] | None],
+        shared_drive_id: str | None = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Searches for several Google Drive Objects at once via the connected api,
+        using a single query instead of one per object.
+
+        Args:
+            *queries (Tuple[str, Literal["sheet", "folder", "file"] | None]): An
+                arbitrary number of (object name, object type) pairs, as would be
+                passed to find_object.
+            shared_drive_id (str, optional): The id of a Shared Drive to search
+                within, if desired, defaults to None.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Each searched object name, with a list
+            of the properties of the objects found with that name.
+
+        """
+        query = " or ".join(
+            f"({self._gen_find_query(obj_name, obj_type)})"
+            for obj_name, obj_type in queries
+        )
+        results: Dict[str, List[Dict[str, Any]]] = {
+            obj_name: [] for obj_name, _ in queries
+        }
+        for obj in self._list_objects(query, shared_drive_id):
+            # The api's name matching can return names we didn't ask for:
+            found = results.get(obj["name"])
+            if found is not None:
+                found.append(obj)
+        return results
+
+    def _gen_find_query(
+        self,
+        obj_name: str,
+        obj_type: Literal["sheet", "folder", "file"] | None = None,
+    ) -> str:
+        """
+        Generates the Drive api search query for an object name and type.
+
+        Args:
+            obj_name (str): The name of the object.
+            obj_type (Literal["sheet", "folder", "file"], optional): The type of
+                object to restrict the search to.
+
+        Returns:
+            str: The search query.
+
         """
         query = f"name = '{obj_name}'"
         if obj_type == "file":
             query += f" and mimeType != '{self.google_obj_types['folder']}'"
         elif obj_type:
             query += f" and mimeType='{self.google_obj_types[obj_type]}'"
+        return query
+
+    def _list_objects(
+        self, query: str, shared_drive_id: str | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Collects every page of results for a Drive api search query.
+
+        Args:
+            query (str): A Drive api search query.
+            shared_drive_id (str, optional): The id of a Shared Drive to search
+                within, if desired, defaults to None.
+
+        Returns:
+            List[Dict[str, Any]]: A list of object properties, if any matches are
+            found.
+
+        """
         kwargs = self._setup_drive_id_kwargs(shared_drive_id)
         page_token = None
         results: List[Dict[str, Any]] = []
@@ -192,6 +311,44 @@ class DriveConnection(Connection):
             fileId=object_id, supportsAllDrives=True
         ).execute()
 
+    def delete_objects(self, *object_ids: str) -> Dict[str, HttpError]:
+        """
+        Deletes the passed Google object ids from the connected Google Drive,
+        sending the deletes in batches instead of one request per object.
+
+        .. note::
+
+            This method will cause a request to be posted to the relevant Google
+            API immediately.
+
+        Args:
+            *object_ids (str): An arbitrary number of Google object ids.
+
+        Returns:
+            Dict[str, HttpError]: Any object ids that could not be deleted, mapped
+            to the error Google returned for them.
+
+        """
+        failed: Dict[str, HttpError] = {}
+        # Batch request ids must be unique:
+        object_ids = tuple(dict.fromkeys(object_ids))
+
+        def callback(request_id: str, _: Any, exception: HttpError | None) -> None:
+            if exception is not None:
+                failed[request_id] = exception
+
+        for i in range(0, len(object_ids), _MAX_BATCH_SIZE):
+            batch = self._core.new_batch_http_request(callback=callback)  # type: ignore
+            for object_id in object_ids[i : i + _MAX_BATCH_SIZE]:
+                batch.add(  # type: ignore
+                    self._files.delete(  # type: ignore
+                        fileId=object_id, supportsAllDrives=True
+                    ),
+                    request_id=object_id,
+                )
+            batch.execute()  # type: ignore
+        return failed
+
     def upload_files(self, *filepaths: Path | str | FileUpload) -> Dict[str, str]:
         """
         Uploads files to the root drive or to a folder.
@@ -258,8 +415,9 @@ class DriveConnection(Connection):
                 f"Could not determine MIMEtype for {p}. Unable to convert to "
                 "Google Drive format."
             )
-        elif mtype in self._fmt_map.keys():
-            return self._fmt_map[mtype]
+        gdrive_type = self._fmt_map.get(mtype)
+        if gdrive_type is not None:
+            return gdrive_type
         else:
             raise ValueError(
                 f"File {p} has MIMEtype {mtype} which is not valid for "
@@ -319,6 +477,67 @@ class SheetsConnection(Connection):
             auth_config=auth_config,
         )
         self._sheets = self._core.spreadsheets()  # type: ignore
+        # Requests held back by batch_mode, by spreadsheet id:
+        self._batch_buffer: Dict[str, List[Dict[str, Any]]] | None = None
+        # How many batch_mode blocks are currently open:
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch_mode(self) -> Iterator[SheetsConnection]:
+        """
+        Context manager that holds back the requests sent through
+        execute_requests (and so every view's commit method) while it is open,
+        then sends them as one batch update per Google Sheet when it closes. If
+        an exception is raised out of the block, the held requests are discarded.
+
+        Blocks can be nested: inner blocks share the outermost block's requests,
+        which are only sent (or discarded) when the outermost block closes.
+
+        Yields:
+            SheetsConnection: This SheetsConnection.
+
+        """
+        if self._batch_depth == 0:
+            self._batch_buffer = {}
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_buffer = None
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sends any requests held back by batch_mode to the Sheets api, one batch
+        update per Google Sheet. Called inside a batch_mode block, requests made
+        afterwards keep being held back until the block closes.
+
+        .. note::
+
+            This method will cause a request to be posted to the relevant Google
+            API immediately.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The response from the Sheets api for each
+            Google Sheet id that had requests sent.
+
+        """
+        buffer = self._batch_buffer or {}
+        self._batch_buffer = None
+        try:
+            results = {
+                spreadsheet_id: self._batch_update(spreadsheet_id, requests)
+                for spreadsheet_id, requests in buffer.items()
+            }
+        finally:
+            if self._batch_depth:
+                self._batch_buffer = {}
+        return results
 
     def execute_requests(
         self, spreadsheet_id: str, requests: List[Dict[str, Any]]
@@ -334,11 +553,67 @@ class SheetsConnection(Connection):
 
         Returns:
             Dict[str, Any]: The resulting response from the Sheets api as a
-            dictionary.
+            dictionary, or an empty dictionary if the requests are being held
+            back by batch_mode.
+
+        """
+        # Preprocessed per call, since preprocessing reorders requests and held
+        # back commits have to be applied in the order they were made:
+        processed = self._preprocess_requests(requests)["requests"]
+        if self._batch_buffer is not None:
+            self._batch_buffer.setdefault(spreadsheet_id, []).extend(processed)
+            return {}
+        return self._batch_update(spreadsheet_id, processed)
+
+    def _batch_update(
+        self, spreadsheet_id: str, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = self._sheets.batchUpdate(  # type: ignore
+            spreadsheetId=spreadsheet_id, body={"requests": requests}
+        ).execute()
+        return result
+
+    def execute_requests_and_get_data(
+        self,
+        spreadsheet_id: str,
+        requests: List[Dict[str, Any]],
+        ranges: List[str],
+        value_type: GoogleValueType | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Sends the passed list of request dictionaries to the Sheets api to be
+        applied to the spreadsheet_id via batch update, and has the api return the
+        updated data from the passed ranges in the same response.
+
+        Args:
+            spreadsheet_id (str): The id of the Google Sheet to update.
+            requests (List[Dict[str, Any]]): A list of dictionaries formatted as
+                requests.
+            ranges (List[str]): A list of range strings (e.g. Sheet1!A1:C3) to
+                collect data from once the requests have been applied.
+            value_type (GoogleValueType, optional): The only value representation
+                to collect, defaults to None, which collects all of them.
+
+        Returns:
+            Dict[str, Any]: The resulting response from the Sheets api as a
+            dictionary. The collected data is under its updatedSpreadsheet key,
+            raw and unparsed, in the same shape get_data returns it.
 
         """
+        processed = self._preprocess_requests(requests)["requests"]
+        if self._batch_buffer:
+            # Held back requests have to be applied before the data is read:
+            processed = self._batch_buffer.pop(spreadsheet_id, []) + processed
+        body: Dict[str, Any] = dict(
+            requests=processed,
+            includeSpreadsheetInResponse=True,
+            responseRanges=ranges,
+            responseIncludeGridData=True,
+        )
         result: Dict[str, Any] = self._sheets.batchUpdate(  # type: ignore
-            spreadsheetId=spreadsheet_id, body=self._preprocess_requests(requests)
+            spreadsheetId=spreadsheet_id,
+            body=body,
+            fields=_gen_update_data_fields(value_type),
         ).execute()
         return result
 
@@ -354,16 +629,17 @@ class SheetsConnection(Connection):
             Dict[str, Any]: A dictionary of the Google Sheet's properties.
 
         """
-        gsheet_props = f"{terms.FILE_PROPS}({terms.FILE_NAME})"
-        grid_props = f"{terms.GRID_PROPS}({terms.COL_CT},{terms.ROW_CT})"
-        tab_props = f"{terms.TAB_IDX},{terms.TAB_ID},{terms.TAB_NAME},{grid_props}"
-        tabs_prop = f"{terms.TABS_PROP}({terms.TAB_PROPS}({tab_props}))"
         return self._sheets.get(  # type: ignore
-            spreadsheetId=spreadsheet_id, fields=f"{gsheet_props},{tabs_prop}"
+            spreadsheetId=spreadsheet_id, fields=_PROPERTIES_FIELDS
         ).execute()
 
     def get_data(
-        self, spreadsheet_id: str, ranges: List[str] | None = None
+        self,
+        spreadsheet_id: str,
+        ranges: List[str] | None = None,
+        *,
+        with_tab_titles: bool = False,
+        value_type: GoogleValueType | None = None,
     ) -> Dict[str, Any]:
         """
         Collects data from cells in the passed spreadsheet.
@@ -373,17 +649,20 @@ class SheetsConnection(Connection):
             ranges (List[str], optional): A list of range strings
                 (e.g. Sheet1!A1:C3), defaults to None, which prompts get_data to
                 fetch all data from all cells.
+            with_tab_titles (bool, optional): Set to True to also collect the title
+                of each tab data is collected from, which is needed to tell apart
+                the data from ranges on different tabs, defaults to False.
+            value_type (GoogleValueType, optional): The only value representation
+                to collect, which keeps the response smaller, defaults to None,
+                which collects all of them.
 
         Returns:
             Dict[str, Any]: The collected data from the spreadsheet, raw and
             unparsed.
 
         """
-        data_values = f"{UserEnteredVal},{FormattedVal},{EffectiveVal}"
-        formatting_values = f"{EffectiveFmt}"
-        values = f"{terms.VALUES}({data_values},{formatting_values})"
         return self._sheets.get(  # type: ignore
             spreadsheetId=spreadsheet_id,
-            fields=f"{terms.TABS_PROP}({terms.DATA}({terms.ROWDATA}({values})))",
+            fields=_gen_data_fields(value_type, with_tab_titles),
             ranges=ranges or [],
         ).execute()
@@ -3,11 +3,22 @@ from .dtypes import (
     EffectiveFmt as EffectiveFmt,
     EffectiveVal as EffectiveVal,
     FormattedVal as FormattedVal,
+    GoogleValueType as GoogleValueType,
     UserEnteredVal as UserEnteredVal,
 )
 from .interfaces import AuthConfig as AuthConfig
+from googleapiclient.errors import HttpError
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, ContextManager, Dict, List, Literal, Tuple, Union
+
+def _gen_properties_fields() -> str: ...
+def _gen_data_fields(
+    value_type: Union[GoogleValueType, None] = ..., with_tab_titles: bool = ...
+) -> str: ...
+def _gen_update_data_fields(value_type: Union[GoogleValueType, None] = ...) -> str: ...
+
+_PROPERTIES_FIELDS: str
+_MAX_BATCH_SIZE: int
 
 class FileUpload:
     path: Path = ...
@@ -37,6 +48,19 @@ class DriveConnection(Connection):
         obj_type: Union[Literal["sheet", "folder", "file"], None] = ...,
         shared_drive_id: Union[str, None] = ...,
     ) -> List[Dict[str, Any]]: ...
+    def find_objects(
+        self,
+        *queries: Tuple[str, Union[Literal["sheet", "folder", "file"], None]],
+        shared_drive_id: Union[str, None] = ...,
+    ) -> Dict[str, List[Dict[str, Any]]]: ...
+    def _gen_find_query(
+        self,
+        obj_name: str,
+        obj_type: Union[Literal["sheet", "folder", "file"], None] = ...,
+    ) -> str: ...
+    def _list_objects(
+        self, query: str, shared_drive_id: Union[str, None] = ...
+    ) -> List[Dict[str, Any]]: ...
     def create_object(
         self,
         obj_name: str,
@@ -44,6 +68,7 @@ class DriveConnection(Connection):
         parent_id: Union[str, None] = ...,
     ) -> str: ...
     def delete_object(self, object_id: str) -> None: ...
+    def delete_objects(self, *object_ids: str) -> Dict[str, HttpError]: ...
     def upload_files(
         self, *filepaths: Union[Path, str, FileUpload]
     ) -> Dict[str, str]: ...
@@ -55,13 +80,32 @@ class DriveConnection(Connection):
 
 class SheetsConnection(Connection):
     _sheets: Any = ...
+    _batch_buffer: Union[Dict[str, List[Dict[str, Any]]], None] = ...
+    _batch_depth: int = ...
     def __init__(
         self, *, auth_config: Union[AuthConfig, None] = ..., api_version: str = ...
     ) -> None: ...
+    def batch_mode(self) -> ContextManager[SheetsConnection]: ...
+    def flush(self) -> Dict[str, Dict[str, Any]]: ...
     def execute_requests(
         self, spreadsheet_id: str, requests: List[Dict[str, Any]]
     ) -> Dict[str, Any]: ...
+    def _batch_update(
+        self, spreadsheet_id: str, requests: List[Dict[str, Any]]
+    ) -> Dict[str, Any]: ...
+    def execute_requests_and_get_data(
+        self,
+        spreadsheet_id: str,
+        requests: List[Dict[str, Any]],
+        ranges: List[str],
+        value_type: Union[GoogleValueType, None] = ...,
+    ) -> Dict[str, Any]: ...
     def get_properties(self, spreadsheet_id: str) -> Dict[str, Any]: ...
     def get_data(
-        self, spreadsheet_id: str, ranges: Union[List[str], None] = ...
+        self,
+        spreadsheet_id: str,
+        ranges: Union[List[str], None] = ...,
+        *,
+        with_tab_titles: bool = ...,
+        value_type: Union[GoogleValueType, None] = ...
     ) -> Dict[str, Any]: ...
@@ -169,6 +169,14 @@ REV_TYPE_MAP = {
 }
 """Dictionary mapping google data types to corresponding python types."""
 
+KEY_MAP = {
+    String.type_key: String,
+    Formula.type_key: Formula,
+    Number.type_key: Number,
+    Boolean.type_key: Boolean,
+}
+"""Dictionary mapping google data type api keys to corresponding google data types."""
+
 
 class _Property:
     """
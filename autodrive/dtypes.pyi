@@ -44,6 +44,7 @@ GOOGLE_VAL_TYPES: Any
 GOOGLE_DTYPES: Any
 TYPE_MAP: Any
 REV_TYPE_MAP: Any
+KEY_MAP: Any
 
 class _Property:
     prop: Any = ...
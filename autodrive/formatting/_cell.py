@@ -13,13 +13,13 @@ def add_alternating_row_background(
     return {
         "addConditionalFormatRule": {
             "rule": {
-                "ranges": [{terms.TAB_ID: tab_id, **dict(rng)}],
+                "ranges": [{terms.TAB_ID: tab_id, **rng.to_dict()}],
                 "booleanRule": {
                     "condition": {
                         "type": "CUSTOM_FORMULA",
                         "values": [{str(UserEnteredVal): "=MOD(ROW(), 2)"}],
                     },
-                    "format": {"backgroundColor": dict(colors)},
+                    "format": {"backgroundColor": colors.to_dict()},
                 },
             },
             "index": rng.start_row,
@@ -30,22 +30,21 @@ def add_alternating_row_background(
 def set_background_color(tab_id: int, rng: FullRange, color: Color):
     return {
         terms.RPT_CELL: {
-            terms.RNG: {terms.TAB_ID: tab_id, **dict(rng)},
+            terms.RNG: {terms.TAB_ID: tab_id, **rng.to_dict()},
             terms.FIELDS: str(UserEnteredFmt),
-            terms.CELL: {str(UserEnteredFmt): {"backgroundColor": dict(color)}},
+            terms.CELL: {str(UserEnteredFmt): {"backgroundColor": color.to_dict()}},
         }
     }
 
 
 def set_border_format(tab_id: int, rng: FullRange, *borders: BorderFormat):
+    border_dicts: Dict[str, Any] = {}
+    for b in borders:
+        border_dicts.update(b.to_dict())
     return {
         terms.RPT_CELL: {
-            terms.RNG: {terms.TAB_ID: tab_id, **dict(rng)},
+            terms.RNG: {terms.TAB_ID: tab_id, **rng.to_dict()},
             terms.FIELDS: str(UserEnteredFmt),
-            terms.CELL: {
-                str(UserEnteredFmt): {
-                    "borders": {**{k: v for b in borders for k, v in dict(b).items()}}
-                }
-            },
+            terms.CELL: {str(UserEnteredFmt): {"borders": border_dicts}},
         }
     }
@@ -11,7 +11,7 @@ def auto_column_width(tab_id: int, rng: HalfRange) -> Dict[str, Any]:
         "autoResizeDimensions": {
             terms.DIMS: {
                 terms.TAB_ID: tab_id,
-                **dict(rng),
+                **rng.to_dict(),
                 terms.DIM: terms.COLDIM,
             }
         }
@@ -33,7 +33,7 @@ def insert_rows(tab_id: int, num_rows: int, at_row: int) -> Dict[str, Any]:
         "insertDimension": {
             terms.RNG: {
                 terms.TAB_ID: tab_id,
-                **dict(HalfRange(at_row, at_row + num_rows, base0_idxs=True)),
+                **HalfRange(at_row, at_row + num_rows, base0_idxs=True).to_dict(),
                 terms.DIM: terms.ROWDIM,
             },
             "inheritFromBefore": False,
@@ -46,7 +46,7 @@ def delete_rows(tab_id: int, rng: HalfRange) -> Dict[str, Any]:
         "deleteDimension": {
             terms.RNG: {
                 terms.TAB_ID: tab_id,
-                **dict(rng),
+                **rng.to_dict(),
                 terms.DIM: terms.ROWDIM,
             }
         }
@@ -96,7 +96,7 @@ def insert_columns(tab_id: int, num_cols: int, at_col: int) -> Dict[str, Any]:
         "insertDimension": {
             terms.RNG: {
                 terms.TAB_ID: tab_id,
-                **dict(HalfRange(at_col, at_col + num_cols, base0_idxs=True)),
+                **HalfRange(at_col, at_col + num_cols, base0_idxs=True).to_dict(),
                 terms.DIM: terms.COLDIM,
             },
             "inheritFromBefore": False,
@@ -109,7 +109,7 @@ def delete_columns(tab_id: int, rng: HalfRange) -> Dict[str, Any]:
         "deleteDimension": {
             terms.RNG: {
                 terms.TAB_ID: tab_id,
-                **dict(rng),
+                **rng.to_dict(),
                 terms.DIM: terms.COLDIM,
             }
         }
@@ -10,9 +10,9 @@ from ..interfaces import Format, FullRange
 def apply_format(tab_id: int, rng: FullRange, fmt: Format) -> Dict[str, Any]:
     return {
         terms.RPT_CELL: {
-            terms.RNG: {terms.TAB_ID: tab_id, **dict(rng)},
+            terms.RNG: {terms.TAB_ID: tab_id, **rng.to_dict()},
             terms.FIELDS: str(fmt),
-            terms.CELL: dict(fmt),
+            terms.CELL: fmt.to_dict(),
         }
     }
 
@@ -30,7 +30,7 @@ def set_text_alignment(
         align_dict["verticalAlignment"] = str(valign)
     return {
         terms.RPT_CELL: {
-            terms.RNG: {terms.TAB_ID: tab_id, **dict(rng)},
+            terms.RNG: {terms.TAB_ID: tab_id, **rng.to_dict()},
             terms.FIELDS: "*",
             terms.CELL: {str(UserEnteredFmt): align_dict},
         }
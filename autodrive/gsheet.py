@@ -4,8 +4,9 @@ from functools import singledispatchmethod
 from typing import Any, Dict, KeysView, List, Optional, ValuesView, Sequence, Literal
 from pathlib import Path
 
+from . import _google_terms as terms
 from .connection import SheetsConnection
-from ._view import GSheetView
+from ._view import Component, GSheetView
 from .interfaces import AuthConfig, FullRange
 from .tab import Tab
 from .range import Range
@@ -18,6 +19,8 @@ class GSheet(GSheetView):
     and Tabs.
     """
 
+    __slots__ = ("_title", "_tabs")
+
     def __init__(
         self,
         gsheet_id: str,
@@ -136,6 +139,32 @@ class GSheet(GSheetView):
         self._requests.append(tab.gen_add_tab_request())
         return self
 
+    def add_tabs(self, *tabs: Tab) -> GSheet:
+        """
+        Adds several Tabs to the GSheet at once. Equivalent to chaining add_tab
+        calls, but only checks the existing tab titles once.
+
+        Args:
+            *tabs (Tab): The Tab instances you want to add.
+
+        Returns:
+            GSheet: This Gsheet.
+
+        Raises:
+            ValueError: If the GSheet already has a Tab with one of the titles, or
+                two of the passed Tabs share a title.
+
+        """
+        titles = {tab.title for tab in self._tabs}
+        for tab in tabs:
+            if tab.title in titles:
+                raise ValueError(f"GSheet already has tab with title {tab.title}")
+            titles.add(tab.title)
+        for tab in tabs:
+            self._tabs.insert(tab.index, tab)
+        self._requests.extend(tab.gen_add_tab_request() for tab in tabs)
+        return self
+
     def gen_range(self, rng: FullRange, tab: str | int | None = None) -> Range:
         """
         Convenience method for generating a new Range object from a Tab in this
@@ -270,6 +299,62 @@ class GSheet(GSheetView):
         tab_.formats = formats
         return self
 
+    def refresh(
+        self,
+        *components: Component[Any, Any, Any],
+        value_type: GoogleValueType = EffectiveVal,
+    ) -> GSheet:
+        """
+        Gets the data from the cells of each of the passed Tabs and Ranges, using a
+        single request to the Sheets api instead of one per Tab or Range.
+
+        .. note::
+
+            This method will cause a request to be posted to the relevant Google
+            API immediately.
+
+        Args:
+            *components (Component): An arbitrary number of Tabs and/or Ranges
+                within this GSheet.
+            value_type (GoogleValueType, optional): Allows you to toggle the
+                type of the values returned by the Google Sheets API. See the
+                :mod:`dtypes <autodrive.dtypes>` documentation for more info on
+                the different GoogleValueTypes.
+
+        Returns:
+            GSheet: This GSheet.
+
+        Raises:
+            ValueError: If one of the components has no tab title and this GSheet
+                has no fetched Tabs to resolve it to the first one with.
+
+        """
+        # The api reads untitled ranges from the first tab and returns each tab's
+        # data in the order its ranges were requested:
+        first_title = self._tabs[0].title if self._tabs else None
+        by_tab: Dict[str, List[Component[Any, Any, Any]]] = {}
+        for component in components:
+            title = component.range.tab_title or first_title
+            if not title:
+                raise ValueError(
+                    f"Cannot refresh {component.range_str} without a tab title, "
+                    "fetch this GSheet first or pass a Range with a tab title."
+                )
+            by_tab.setdefault(title, []).append(component)
+        raw = self.conn.get_data(
+            self._gsheet_id,
+            [component.range_str for component in components],
+            with_tab_titles=True,
+            value_type=value_type,
+        )
+        for tab in raw.get(terms.TABS_PROP, []):
+            title = tab[terms.TAB_PROPS][terms.TAB_NAME]
+            for component, data in zip(by_tab.get(title, []), tab[terms.DATA]):
+                component.values, component.formats = self._parse_row_data(
+                    data.get(terms.ROWDATA, []), value_type=value_type
+                )
+        return self
+
     def __iter__(self):
         return self._tabs
 
@@ -1,4 +1,4 @@
-from ._view import GSheetView as GSheetView
+from ._view import Component as Component, GSheetView as GSheetView
 from .connection import SheetsConnection as SheetsConnection
 from .dtypes import EffectiveVal as EffectiveVal, GoogleValueType as GoogleValueType
 from .interfaces import AuthConfig as AuthConfig, FullRange as FullRange
@@ -38,6 +38,7 @@ class GSheet(GSheetView):
     def title(self) -> Optional[str]: ...
     def fetch(self) -> GSheet: ...
     def add_tab(self, tab: Tab) -> GSheet: ...
+    def add_tabs(self, *tabs: Tab) -> GSheet: ...
     def gen_range(self, rng: FullRange, tab: Union[str, int, None] = ...) -> Range: ...
     def write_values(
         self,
@@ -52,6 +53,11 @@ class GSheet(GSheetView):
         rng: Union[FullRange, str, None] = ...,
         value_type: GoogleValueType = ...,
     ) -> GSheet: ...
+    def refresh(
+        self,
+        *components: Component[Any, Any, Any],
+        value_type: GoogleValueType = ...
+    ) -> GSheet: ...
     def __iter__(self) -> Any: ...
     def __len__(self) -> int: ...
     def __getitem__(self, key: Union[int, str]) -> Tab: ...
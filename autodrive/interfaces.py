@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import string
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
 
@@ -16,6 +17,19 @@ DEFAULT_CREDS = "credentials.json"
 
 _T = TypeVar("_T")
 
+# The range/cell strings and column indices in a workbook repeat constantly, so
+# their (pure) parsing and conversion functions are memoized up to this many
+# distinct inputs:
+_PARSE_CACHE_SIZE = 4096
+
+# Tab titles that can be used in a range string without being quoted:
+_UNQUOTED_TITLE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Column letters and their 1-based positions in a column identifier (A=1...Z=26):
+_ALPHA_TO_NUM = {a: i for i, a in enumerate(string.ascii_uppercase, start=1)}
+# Range strings (Sheet1!A1:B3) and their individual cells (A1):
+_RANGE_RE = re.compile(r"(?:(.*)!)?([A-Z]+\d+)(?::([A-Z]*\d*))?")
+_CELL_RE = re.compile(r"([A-Z]+)(\d+)?")
+
 
 class ParseRangeError(Exception):
     """
@@ -116,6 +130,7 @@ class _RangeInterface(_Interface[int]):
         return {}
 
     @classmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _construct_range_str(
         cls,
         start_row: int = 0,
@@ -141,24 +156,44 @@ class _RangeInterface(_Interface[int]):
             str: A string in the format (tab_name!start_cell:end_cell)
 
         """
-        start_letter = ""
-        end_letter = ""
-        end_row_int = end_row + 1 if end_row else end_row
-        end_col_int = end_col if end_col is not None else start_col
-        start_letter = cls._convert_col_idx_to_alpha(start_col)
-        end_letter = cls._convert_col_idx_to_alpha(end_col_int)
-        start_int = start_row + 1
-        if end_col or end_row:
-            end_part = f":{end_letter}{end_row_int or ''}"
-        else:
-            end_part = ""
-        return f"{start_letter}{start_int}{end_part}"
+        start = f"{cls._convert_col_idx_to_alpha(start_col)}{start_row + 1}"
+        if not (end_col or end_row):
+            return start
+        end_letter = cls._convert_col_idx_to_alpha(
+            start_col if end_col is None else end_col
+        )
+        end_num = "" if end_row is None else end_row + 1
+        return f"{start}:{end_letter}{end_num}"
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _add_tab_title(rng: str, tab_title: str | None = None) -> str:
+        """
+        Prefixes the passed range string with the passed tab title (Sheet1!A1:B3),
+        quoting the title if it contains spaces or other characters that the
+        Sheets api requires quotes for ('My Sheet'!A1:B3).
+
+        Args:
+            rng (str): A range string without a tab title (A1:B3).
+            tab_title (str, optional): The tab title to prefix rng with, defaults
+                to None, in which case rng is returned unchanged.
+
+        Returns:
+            str: The range string prefixed with the tab title, if any.
+
+        """
+        if not tab_title:
+            return rng
+        if not _UNQUOTED_TITLE.fullmatch(tab_title):
+            tab_title = "'" + tab_title.replace("'", "''") + "'"
+        return f"{tab_title}!{rng}"
+
+    @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _parse_range_str(rng: str) -> Tuple[Optional[str], str, Optional[str]]:
         """
         Parses a range string (Sheet1:A1:B3) into its component groups ("Sheet1",
-        "A1", "B3").
+        "A1", "B3"). Quoted tab titles ('My Sheet'!A1) are returned unquoted.
 
         Args:
             rng (str): The range string, which must at least be one cell coordinate
@@ -172,14 +207,17 @@ class _RangeInterface(_Interface[int]):
             ParseRangeError: If the range is invalid.
 
         """
-        result = re.match(r"(?:(.*)!)?([A-Z]+\d+)(?::([A-Z]*\d*))?", rng)
+        result = _RANGE_RE.match(rng)
         if result:
-            grps = result.groups()
-            return grps  # type: ignore
+            title, start, end = result.groups()
+            if title and len(title) > 1 and title[0] == title[-1] == "'":
+                title = title[1:-1].replace("''", "'")
+            return title, start, end
         else:
             raise ParseRangeError(rng)
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _parse_cell_str(cell_str: str) -> Tuple[str, Optional[str]]:
         """
         Parses an individual cell string (A1) into its component strings ("A", "1")
@@ -195,7 +233,7 @@ class _RangeInterface(_Interface[int]):
             ParseRangeError: If the range is invalid.
 
         """
-        result = re.match(r"([A-Z]+)(\d+)?", cell_str)
+        result = _CELL_RE.match(cell_str)
         if result:
             grps = result.groups()
             return grps  # type: ignore
@@ -222,6 +260,7 @@ class _RangeInterface(_Interface[int]):
         return col_idx, row_idx
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _convert_alpha_col_to_idx(alpha_col: str) -> int:
         """
         Converts a string column identifier (A, B, C, ...Z, AA, AAA, etc) into a
@@ -234,14 +273,13 @@ class _RangeInterface(_Interface[int]):
             int: The numeric representation of the alpha_col's index.
 
         """
-        values: List[int] = []
-        for i, a in enumerate(alpha_col, start=1):  # type: ignore
-            base_idx = string.ascii_uppercase.index(a) + 1  # type: ignore
-            remainder = len(alpha_col[i:])
-            values.append(26 ** remainder * base_idx)
-        return sum(values) - 1
+        total = 0
+        for a in alpha_col:
+            total = total * 26 + _ALPHA_TO_NUM[a]
+        return total - 1
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def _convert_col_idx_to_alpha(idx: int) -> str:
         """
         Converts a (0-based) index into a string column identifier.
@@ -253,15 +291,18 @@ class _RangeInterface(_Interface[int]):
             str: The string representation of the idx's position.
 
         """
+        letters = string.ascii_uppercase
+        # One and two letter columns (A-ZZ) cover nearly every real sheet:
+        if idx < 26:
+            return letters[idx]
+        if idx < 702:
+            first, second = divmod(idx - 26, 26)
+            return letters[first] + letters[second]
         chars: List[str] = []
         col_num = idx + 1
         while col_num > 0:
-            remainder = col_num % 26
-            if remainder == 0:
-                remainder = 26
-            col_letter = chr(ord("A") + remainder - 1)
-            chars.append(col_letter)
-            col_num = int((col_num - 1) / 26)
+            col_num, remainder = divmod(col_num - 1, 26)
+            chars.append(letters[remainder])
         chars.reverse()
         return "".join(chars)
 
@@ -370,7 +411,7 @@ class HalfRange(_RangeInterface):
                 f"{self}.column indicator is False. Cannot convert row HalfRanges to "
                 "strings."
             )
-        return f"{self.tab_title or ''}{'!' if self.tab_title else ''}{rng}"
+        return self._add_tab_title(rng, self.tab_title)
 
 
 class FullRange(_RangeInterface):
@@ -416,22 +457,16 @@ class FullRange(_RangeInterface):
         super().__init__(tab_title)
         self._single_cell = False
         if range_str:
-            title, start, end = self._parse_range_str(range_str)
+            (
+                title,
+                self.start_row,
+                self.end_row,
+                self.start_col,
+                self.end_col,
+                self._single_cell,
+            ) = self._parse_full_range_str(range_str)
             if title and not self.tab_title:
                 self.tab_title = title
-            cstart, rstart = self._convert_cell_str_to_coord(start)
-            if rstart is None:
-                raise ParseRangeError(range_str)
-            if end:
-                cend, rend = self._convert_cell_str_to_coord(end)
-            else:
-                cend = cstart + 1
-                rend = rstart + 1
-                self._single_cell = True
-            self.start_row = rstart
-            self.end_row = rend
-            self.start_col = cstart
-            self.end_col = cend
         else:
             self.start_row = self._parse_idx(start_row, base0_idxs) if start_row else 0
             self.start_col = self._parse_idx(start_col, base0_idxs) if start_col else 0
@@ -446,6 +481,38 @@ class FullRange(_RangeInterface):
             if end_row is None and end_col is None:
                 self._single_cell = True
 
+    @classmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def _parse_full_range_str(
+        cls, range_str: str
+    ) -> Tuple[Optional[str], int, Optional[int], int, int, bool]:
+        """
+        Parses a range string (e.g. Sheet1!A1:B3) all the way down to the
+        0-based indices of a FullRange, so that FullRanges built from the same
+        range string only parse it once.
+
+        Args:
+            range_str (str): A range string (e.g. Sheet1!A1:B3, A1:B3, A1).
+
+        Returns:
+            Tuple[Optional[str], int, Optional[int], int, int, bool]: The sheet
+            title (if present), the start row, end row (if present), start
+            column, and end column indices, and whether the range is a single
+            cell.
+
+        Raises:
+            ParseRangeError: If the range is invalid.
+
+        """
+        title, start, end = cls._parse_range_str(range_str)
+        cstart, rstart = cls._convert_cell_str_to_coord(start)
+        if rstart is None:
+            raise ParseRangeError(range_str)
+        if end:
+            cend, rend = cls._convert_cell_str_to_coord(end)
+            return title, rstart, rend, cstart, cend, False
+        return title, rstart, rstart + 1, cstart, cstart + 1, True
+
     @property
     def row_range(self) -> HalfRange:
         """
@@ -482,7 +549,7 @@ class FullRange(_RangeInterface):
             rng = self._construct_range_str(
                 self.start_row, self.start_col, self.end_row, self.end_col
             )
-        return f"{self.tab_title or ''}{'!' if self.tab_title else ''}{rng}"
+        return self._add_tab_title(rng, self.tab_title)
 
     def to_dict(self) -> Dict[str, int]:
         """
@@ -541,7 +608,7 @@ class BorderFormat(_Interface[Any]):
         """
         return {
             str(self.side): {
-                "color": dict(self.color),
+                "color": self.color.to_dict(),
                 "style": str(self.style),
             }
         }
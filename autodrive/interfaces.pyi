@@ -10,6 +10,10 @@ from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, TypeVar, Union
 DEFAULT_TOKEN: str
 DEFAULT_CREDS: str
 _T = TypeVar("_T")
+_PARSE_CACHE_SIZE: int
+_RANGE_RE: Any
+_CELL_RE: Any
+_ALPHA_TO_NUM: Dict[str, int]
 
 class ParseRangeError(Exception):
     def __init__(
@@ -50,6 +54,8 @@ class _RangeInterface(_Interface[int]):
         end_col: Optional[int] = ...,
     ) -> str: ...
     @staticmethod
+    def _add_tab_title(rng: str, tab_title: Union[str, None] = ...) -> str: ...
+    @staticmethod
     def _parse_range_str(rng: str) -> Tuple[Optional[str], str, Optional[str]]: ...
     @staticmethod
     def _parse_cell_str(cell_str: str) -> Tuple[str, Optional[str]]: ...
@@ -98,6 +104,10 @@ class FullRange(_RangeInterface):
         base0_idxs: bool = ...,
         tab_title: Union[str, None] = ...
     ) -> None: ...
+    @classmethod
+    def _parse_full_range_str(
+        cls: Any, range_str: str
+    ) -> Tuple[Optional[str], int, Optional[int], int, int, bool]: ...
     @property
     def row_range(self) -> HalfRange: ...
     @property
@@ -18,6 +18,8 @@ class Range(Component[RangeCellFormatting, RangeGridFormatting, RangeTextFormatt
     Provides a connection to the data in a specific range in a Google Sheet Tab.
     """
 
+    __slots__ = ("_tab_title",)
+
     def __init__(
         self,
         gsheet_range: FullRange | str,
@@ -115,6 +117,32 @@ class Range(Component[RangeCellFormatting, RangeGridFormatting, RangeTextFormatt
         )
         return self
 
+    def commit_and_fetch(self, value_type: GoogleValueType = EffectiveVal) -> Range:
+        """
+        Commits the amassed requests on this Range and gets the resulting data
+        from its cells, using a single request to the Sheets api instead of
+        calling commit and get_data separately.
+
+        .. note::
+
+            This method will cause a request to be posted to the relevant Google
+            API immediately.
+
+        Args:
+            value_type (GoogleValueType, optional): Allows you to toggle the
+                type of the values returned by the Google Sheets API. See the
+                :mod:`dtypes <autodrive.dtypes>` documentation for more info on
+                the different GoogleValueTypes.
+
+        Returns:
+          Range: This Range.
+
+        """
+        self._values, self._formats = self._commit_and_get_data(
+            str(self._rng), value_type
+        )
+        return self
+
     def write_values(self, data: Sequence[Sequence[Any] | Dict[str, Any]]) -> Range:
         """
         Adds a request to write data. Range.commit () to commit the requests.
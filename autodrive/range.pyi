@@ -30,6 +30,7 @@ class Range(Component[RangeCellFormatting, RangeGridFormatting, RangeTextFormatt
     @property
     def format_cell(self) -> RangeCellFormatting: ...
     def get_data(self, value_type: GoogleValueType = ...) -> Range: ...
+    def commit_and_fetch(self, value_type: GoogleValueType = ...) -> Range: ...
     def write_values(
         self, data: Sequence[Union[Sequence[Any], Dict[str, Any]]]
     ) -> Range: ...
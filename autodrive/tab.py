@@ -21,6 +21,8 @@ class Tab(Component[TabCellFormatting, TabGridFormatting, TabTextFormatting]):
     data.
     """
 
+    __slots__ = ("_title", "_index", "_column_count", "_row_count")
+
     def __init__(
         self,
         gsheet_id: str,
@@ -289,6 +291,40 @@ class Tab(Component[TabCellFormatting, TabGridFormatting, TabTextFormatting]):
         )
         return self
 
+    def commit_and_fetch(
+        self,
+        rng: FullRange | str | None = None,
+        value_type: GoogleValueType = EffectiveVal,
+    ) -> Tab:
+        """
+        Commits the amassed requests on this Tab and gets the resulting data
+        from its cells, using a single request to the Sheets api instead of
+        calling commit and get_data separately.
+
+        .. note::
+
+            This method will cause a request to be posted to the relevant Google
+            API immediately.
+
+        Args:
+            rng (FullRange | HalfRange, optional): An optional range value, to
+                specify a subset of the Tab's values to get, defaults to None,
+                which fetches all values in the Tab.
+            value_type (GoogleValueType, optional): Allows you to toggle the
+                type of the values returned by the Google Sheets API. See the
+                :mod:`dtypes <autodrive.dtypes>` documentation for more info on
+                the different GoogleValueTypes.
+
+        Returns:
+            Tab: This Tab.
+
+        """
+        rng = self.ensure_full_range(self.full_range(), rng)
+        if not rng.tab_title:
+            rng.tab_title = self._title
+        self._values, self._formats = self._commit_and_get_data(str(rng), value_type)
+        return self
+
     def write_values(
         self,
         data: Sequence[Sequence[Any] | Dict[str, Any]],
@@ -389,10 +425,7 @@ class Tab(Component[TabCellFormatting, TabGridFormatting, TabTextFormatting]):
             Tab: This Tab.
 
         """
-        req = self.new_tab_request(
-            self.title, self.tab_id, self.index, self.row_count, self.column_count
-        )
-        self._requests.append(req)
+        self._requests.append(self.gen_add_tab_request())
         self.commit()
         return self
 
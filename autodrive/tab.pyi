@@ -63,6 +63,9 @@ class Tab(Component[TabCellFormatting, TabGridFormatting, TabTextFormatting]):
     def get_data(
         self, rng: Union[FullRange, str, None] = ..., value_type: GoogleValueType = ...
     ) -> Tab: ...
+    def commit_and_fetch(
+        self, rng: Union[FullRange, str, None] = ..., value_type: GoogleValueType = ...
+    ) -> Tab: ...
     def write_values(
         self,
         data: Sequence[Union[Sequence[Any], Dict[str, Any]]],
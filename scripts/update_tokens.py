@@ -2,6 +2,8 @@ from typing import Any, Dict
 import json
 import requests
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 from nacl.public import SealedBox, PublicKey  # type: ignore
 from nacl.encoding import Base64Encoder  # type: ignore
@@ -12,25 +14,24 @@ token_secret = "AUTODRIVE_TOKEN"
 refresh_secret = "AUTODRIVE_REFR_TOKEN"
 secrets_url = "https://api.github.com/repos/chrislarabee/autodrive/actions/secrets"
 
+# Shared so every call to the GitHub api reuses the same keep-alive connection:
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 
 def load_github_pat() -> str:
-    pat = ""
     with open("github_pat.txt", "r") as r:
-        for line in r:
-            pat = line
-    return pat
+        return r.read().strip()
 
 
 def load_tokens() -> Dict[str, Any]:
-    token: Dict[str, Any] = {}
     result: Dict[str, str] = {}
 
     with open("gdrive_token.json", "r") as r:
-        for line in r:
-            token = json.loads(line)
-    if token_key in token.keys():
+        token: Dict[str, Any] = json.load(r)
+    if token_key in token:
         result[token_secret] = token[token_key]
-    if refresh_key in token.keys():
+    if refresh_key in token:
         result[refresh_secret] = token[refresh_key]
     return result
 
@@ -42,9 +43,9 @@ def gen_header(pat: str) -> Dict[str, str]:
     }
 
 
-def get_repo_public_key(pat: str) -> Dict[str, str]:
+def get_repo_public_key() -> Dict[str, str]:
     url = secrets_url + "/public-key"
-    response = requests.get(url, headers=gen_header(pat))
+    response = session.get(url)
     resp_json = response.json()
     if "key" in resp_json.keys():
         return resp_json
@@ -59,36 +60,44 @@ def encrypt_secret(secret_value: str, public_key: str) -> str:
     return b64encode(encrypted).decode("utf-8")  # type: ignore
 
 
+def put_secret(secret: str, encrypted_secret: str, key_id: str) -> Dict[str, Any]:
+    url = f"{secrets_url}/{secret}"
+    data = {"encrypted_value": encrypted_secret, "key_id": key_id}
+    print(f"PUT {secret} to {url}...")
+    response = session.put(url, json=data)
+    result: Dict[str, Any] = {}
+    # Put response has no text, only status_code.
+    result["status_code"] = response.status_code
+    if response.status_code == 204:
+        result["response"] = "Successful upload."
+    else:
+        result["response"] = "Unknown response."
+    print(f"  > {secret} result = {result}")
+    return result
+
+
 def send_updated_tokens(
-    pat: str, token_dict: Dict[str, str], public_key: Dict[str, str]
+    token_dict: Dict[str, str], public_key: Dict[str, str]
 ) -> Dict[str, Dict[str, Any]]:
     key: str = public_key["key"]
     key_id: str = public_key["key_id"]
     results: Dict[str, Dict[str, Any]] = {k: {} for k in token_dict.keys()}
-    for secret, token in token_dict.items():
-        url = f"{secrets_url}/{secret}"
-        encrypted_secret = encrypt_secret(token, key)
-        data = {"encrypted_value": encrypted_secret, "key_id": key_id}
-        print(f"PUT {secret} to {url}...")
-        response = requests.put(
-            url,
-            json=data,
-            headers=gen_header(pat),
-        )
-        result: Dict[str, Any] = {}
-        # Put response has no text, only status_code.
-        result["status_code"] = response.status_code
-        if response.status_code == 204:
-            result["response"] = "Successful upload."
-        else:
-            result["response"] = "Unknown response."
-        print(f"  > Result = {result}")
-        results[secret] = result
+    # Encrypt up front so the worker threads below only wait on the network:
+    encrypted = {s: encrypt_secret(t, key) for s, t in token_dict.items()}
+    # Each secret is an independent request, so send them concurrently:
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(encrypted)))) as ex:
+        futures = {
+            ex.submit(put_secret, secret, encrypted_secret, key_id): secret
+            for secret, encrypted_secret in encrypted.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
     return results
 
 
 if __name__ == "__main__":
-    pat = load_github_pat()
+    # Every request carries the same auth headers, so set them on the session once:
+    session.headers.update(gen_header(load_github_pat()))
     tokens = load_tokens()
-    ad_pub_key = get_repo_public_key(pat)
-    results = send_updated_tokens(pat, tokens, ad_pub_key)
+    ad_pub_key = get_repo_public_key()
+    results = send_updated_tokens(tokens, ad_pub_key)
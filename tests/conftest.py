@@ -1,14 +1,33 @@
+from __future__ import annotations
+
 import os
 import warnings
-from datetime import datetime as dt
 
 import pytest
+from googleapiclient.http import HttpRequest
 
 from autodrive.connection import DriveConnection, SheetsConnection
 from autodrive.gsheet import GSheet
-from autodrive.interfaces import DEFAULT_CREDS, DEFAULT_TOKEN
+from autodrive.interfaces import DEFAULT_CREDS, DEFAULT_TOKEN, AuthConfig, FullRange
+from autodrive.range import Range
+from autodrive.tab import Tab
+
+from .testing_tools import (
+    CREATED_IDS,
+    RATE_LIMIT_RETRIES,
+    delete_created_ids,
+    unique_name,
+)
+
+# Checked once so both connection fixtures make the same decision:
+_HAS_CREDS = bool(
+    DriveConnection.get_creds_from_env()
+    or os.path.exists(DEFAULT_TOKEN)
+    or os.path.exists(DEFAULT_CREDS)
+)
 
-from .testing_tools import CREATED_IDS
+# Set by the drive_conn fixture so pytest_sessionfinish can clean up with it:
+_drive_conn: DriveConnection | None = None
 
 conn_warning = (
     "No {0} or {1} found in {2}. Autodrive is not being fully tested. To execute "
@@ -16,33 +35,43 @@ conn_warning = (
 )
 
 
+@pytest.fixture(autouse=True)
+def retry_rate_limited_calls(request, monkeypatch):  # type: ignore
+    # Individual api calls made by connection tests are retried if they trip the
+    # per-minute write quota. Rerunning whole tests instead would repeat the side
+    # effects (created files, appended rows) of everything before the failure.
+    if "connection" in request.keywords:  # type: ignore
+        execute = HttpRequest.execute
+
+        def execute_with_retries(self, http=None, num_retries=0):  # type: ignore
+            return execute(
+                self, http=http, num_retries=num_retries or RATE_LIMIT_RETRIES
+            )
+
+        monkeypatch.setattr(HttpRequest, "execute", execute_with_retries)
+
+
 @pytest.fixture(scope="session")
-def drive_conn():
-    if (
-        DriveConnection.get_creds_from_env()
-        or os.path.exists(DEFAULT_TOKEN)
-        or os.path.exists(DEFAULT_CREDS)
-    ):
-        conn = DriveConnection()
-        yield conn
-        # warnings.warn("Cleaning up google drive objects created for tests...")
-        ids = CREATED_IDS
-        for i in ids:
-            conn.delete_object(i)
-        # warnings.warn(f"Successfully cleaned up {len(ids)} objects.")
+def auth_config():
+    # Shared by both connections so the suite only authenticates once:
+    return AuthConfig()
+
+
+@pytest.fixture(scope="session")
+def drive_conn(auth_config: AuthConfig):
+    if _HAS_CREDS:
+        global _drive_conn
+        _drive_conn = DriveConnection(auth_config=auth_config)
+        return _drive_conn
     else:
         warnings.warn(conn_warning.format(DEFAULT_CREDS, DEFAULT_TOKEN, os.getcwd()))
-        yield None
+        return None
 
 
 @pytest.fixture(scope="session")
-def sheets_conn():
-    if (
-        SheetsConnection.get_creds_from_env()
-        or os.path.exists(DEFAULT_TOKEN)
-        or os.path.exists(DEFAULT_CREDS)
-    ):
-        conn = SheetsConnection()
+def sheets_conn(auth_config: AuthConfig):
+    if _HAS_CREDS:
+        conn = SheetsConnection(auth_config=auth_config)
         yield conn
     else:
         warnings.warn(conn_warning.format(DEFAULT_CREDS, DEFAULT_TOKEN, os.getcwd()))
@@ -51,17 +80,16 @@ def sheets_conn():
 
 @pytest.fixture(scope="session")
 def test_gsheet(drive_conn: DriveConnection, sheets_conn: SheetsConnection):
-    title = f"autodrive_test_sheet-{dt.now()}"
+    title = unique_name("autodrive_test_sheet")
     if drive_conn:
         id_str = drive_conn.create_object(title, "sheet")
-        CREATED_IDS.insert(0, id_str)
-        gsheet = GSheet(
+        CREATED_IDS.append((id_str, None))
+        # Not fetched here, since most tests only need the id; see fetched_gsheet:
+        return GSheet(
             id_str,
             title,
             sheets_conn=sheets_conn,
         )
-        gsheet.fetch()
-        return gsheet
     else:
         return GSheet(
             "test",
@@ -70,6 +98,49 @@ def test_gsheet(drive_conn: DriveConnection, sheets_conn: SheetsConnection):
         )
 
 
+@pytest.fixture(scope="session")
+def fetched_gsheet(test_gsheet: GSheet, drive_conn: DriveConnection):
+    # Only fetches test_gsheet's tabs once a test actually needs them:
+    if drive_conn:
+        test_gsheet.fetch()
+    return test_gsheet
+
+
+@pytest.fixture(scope="session")
+def shared_test_tab(test_gsheet: GSheet, sheets_conn: SheetsConnection):
+    tab = Tab(
+        test_gsheet.gsheet_id,
+        tab_title="test_sheet",
+        tab_idx=1,
+        tab_id=123456789,
+        sheets_conn=sheets_conn,
+    )
+    # The tab is removed along with test_gsheet, so it isn't added to CREATED_IDS:
+    if sheets_conn:
+        tab.create()
+    return tab
+
+
+@pytest.fixture
+def a1c3_range():
+    # Function scoped because FullRange is mutable (e.g. tab_title gets set on
+    # ranges passed to get_data), so tests can't leak changes into each other:
+    return Range(
+        FullRange("Sheet1!A1:C3"),
+        tab_title="",
+        tab_id=0,
+        gsheet_id="test",
+        autoconnect=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def input_data():
+    # Kept as lists so they compare equal to the values read back from Sheets;
+    # tests must not mutate them.
+    return [[1, 2, 3], [4, 5, 6]]
+
+
 def pytest_addoption(parser):  # type: ignore
     parser.addoption(  # type: ignore
         "--connect",
@@ -95,3 +166,9 @@ def pytest_collection_modifyitems(config, items):  # type: ignore
     for item in items:  # type: ignore
         if "connection" in item.keywords:  # type: ignore
             item.add_marker(skip_tests)  # type: ignore
+
+
+def pytest_sessionfinish(session, exitstatus):  # type: ignore
+    if _drive_conn is not None and CREATED_IDS:
+        # warnings.warn("Cleaning up google drive objects created for tests...")
+        delete_created_ids(_drive_conn)
@@ -2,6 +2,97 @@ from autodrive.dtypes import BorderDashed, BorderLeft, BorderRight
 from autodrive.formatting import _cell as cell
 from autodrive.interfaces import FullRange, Color, BorderFormat
 
+_EXPECTED_ALT_ROW_BG = {
+    "addConditionalFormatRule": {
+        "rule": {
+            "ranges": [
+                {
+                    "sheetId": 0,
+                    "startRowIndex": 1,
+                    "endRowIndex": 5,
+                    "startColumnIndex": 0,
+                    "endColumnIndex": 10,
+                }
+            ],
+            "booleanRule": {
+                "condition": {
+                    "type": "CUSTOM_FORMULA",
+                    "values": [{"userEnteredValue": "=MOD(ROW(), 2)"}],
+                },
+                "format": {
+                    "backgroundColor": {
+                        "red": 0.2,
+                        "green": 0.3,
+                        "blue": 0,
+                        "alpha": 1,
+                    }
+                },
+            },
+        },
+        "index": 1,
+    }
+}
+
+_EXPECTED_BACKGROUND_COLOR = {
+    "repeatCell": {
+        "range": {
+            "sheetId": 0,
+            "startRowIndex": 4,
+            "endRowIndex": 10,
+            "startColumnIndex": 1,
+            "endColumnIndex": 4,
+        },
+        "cell": {
+            "userEnteredFormat": {
+                "backgroundColor": {
+                    "red": 0.4,
+                    "blue": 0.3,
+                    "green": 0.7,
+                    "alpha": 1.0,
+                }
+            }
+        },
+        "fields": "userEnteredFormat",
+    }
+}
+
+_EXPECTED_BORDER_FORMAT = {
+    "repeatCell": {
+        "range": {
+            "sheetId": 0,
+            "startRowIndex": 4,
+            "endRowIndex": 10,
+            "startColumnIndex": 1,
+            "endColumnIndex": 4,
+        },
+        "cell": {
+            "userEnteredFormat": {
+                "borders": {
+                    "left": {
+                        "color": {
+                            "red": 0.0,
+                            "green": 1.0,
+                            "blue": 0.0,
+                            "alpha": 1.0,
+                        },
+                        "style": "SOLID",
+                    },
+                    "right": {
+                        "color": {
+                            "red": 0.0,
+                            "green": 0.0,
+                            "blue": 0.0,
+                            "alpha": 1.0,
+                        },
+                        "style": "DASHED",
+                    },
+                }
+            }
+        },
+        "fields": "userEnteredFormat",
+    }
+}
+
 
 def test_add_alternating_row_background():
     result = cell.add_alternating_row_background(
@@ -9,62 +100,12 @@ def test_add_alternating_row_background():
         FullRange(start_row=1, end_row=4, start_col=0, end_col=9, base0_idxs=True),
         Color(0.2, 0.3),
     )
-    assert result == {
-        "addConditionalFormatRule": {
-            "rule": {
-                "ranges": [
-                    {
-                        "sheetId": 0,
-                        "startRowIndex": 1,
-                        "endRowIndex": 5,
-                        "startColumnIndex": 0,
-                        "endColumnIndex": 10,
-                    }
-                ],
-                "booleanRule": {
-                    "condition": {
-                        "type": "CUSTOM_FORMULA",
-                        "values": [{"userEnteredValue": "=MOD(ROW(), 2)"}],
-                    },
-                    "format": {
-                        "backgroundColor": {
-                            "red": 0.2,
-                            "green": 0.3,
-                            "blue": 0,
-                            "alpha": 1,
-                        }
-                    },
-                },
-            },
-            "index": 1,
-        }
-    }
+    assert result == _EXPECTED_ALT_ROW_BG
 
 
 def test_set_background_color():
     result = cell.set_background_color(0, FullRange("B5:D10"), Color(0.4, 0.7, 0.3))
-    assert result == {
-        "repeatCell": {
-            "range": {
-                "sheetId": 0,
-                "startRowIndex": 4,
-                "endRowIndex": 10,
-                "startColumnIndex": 1,
-                "endColumnIndex": 4,
-            },
-            "cell": {
-                "userEnteredFormat": {
-                    "backgroundColor": {
-                        "red": 0.4,
-                        "blue": 0.3,
-                        "green": 0.7,
-                        "alpha": 1.0,
-                    }
-                }
-            },
-            "fields": "userEnteredFormat",
-        }
-    }
+    assert result == _EXPECTED_BACKGROUND_COLOR
 
 
 def test_set_border_format():
@@ -74,39 +115,4 @@ def test_set_border_format():
         BorderFormat(BorderLeft, Color(0, 1.0, 0)),
         BorderFormat(BorderRight, style=BorderDashed),
     )
-    assert result == {
-        "repeatCell": {
-            "range": {
-                "sheetId": 0,
-                "startRowIndex": 4,
-                "endRowIndex": 10,
-                "startColumnIndex": 1,
-                "endColumnIndex": 4,
-            },
-            "cell": {
-                "userEnteredFormat": {
-                    "borders": {
-                        "left": {
-                            "color": {
-                                "red": 0.0,
-                                "green": 1.0,
-                                "blue": 0.0,
-                                "alpha": 1.0,
-                            },
-                            "style": "SOLID",
-                        },
-                        "right": {
-                            "color": {
-                                "red": 0.0,
-                                "green": 0.0,
-                                "blue": 0.0,
-                                "alpha": 1.0,
-                            },
-                            "style": "DASHED",
-                        },
-                    }
-                }
-            },
-            "fields": "userEnteredFormat",
-        }
-    }
+    assert result == _EXPECTED_BORDER_FORMAT
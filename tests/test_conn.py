@@ -1,13 +1,162 @@
-from autodrive._conn import Connection
+import pytest
+from pytest_mock import MockerFixture
+
+from autodrive import _conn
+from autodrive._conn import Connection, _FastJsonModel, _load_discovery_doc
+from autodrive.connection import DriveConnection, SheetsConnection
+from autodrive.interfaces import AuthConfig
+from autodrive.tab import Tab
+
+
+class TestFastJsonModel:
+    def test_that_it_round_trips_request_bodies(self):
+        pytest.importorskip("orjson")
+        model = _FastJsonModel()
+        body = {"requests": [{"updateCells": {"rows": [{"values": [1.5, "a"]}]}}]}
+        result = model.serialize(body)
+        assert isinstance(result, str)
+        assert model.deserialize(result) == body
+        assert model.deserialize(model.serialize({1: "a"})) == {"1": "a"}
 
 
 class TestConnection:
+    def test_that_it_reuses_creds_for_the_same_auth_config(self, mocker: MockerFixture):
+        auth = mocker.patch.object(Connection, "_authenticate")
+        mocker.patch("autodrive._conn.build_from_document")
+        config = AuthConfig()
+        SheetsConnection(auth_config=config)
+        SheetsConnection(auth_config=config)
+        assert auth.call_count == 1
+        SheetsConnection(auth_config=AuthConfig())
+        assert auth.call_count == 2
+
+    def test_that_it_reuses_the_discovery_doc(self, mocker: MockerFixture):
+        mocker.patch.object(Connection, "_authenticate")
+        build = mocker.patch("autodrive._conn.build_from_document")
+        _load_discovery_doc.cache_clear()
+        get_static_doc = mocker.patch(
+            "autodrive._conn.get_static_doc", wraps=_conn.get_static_doc
+        )
+        SheetsConnection(auth_config=AuthConfig())
+        SheetsConnection(auth_config=AuthConfig())
+        get_static_doc.assert_called_once_with("sheets", "v4")
+        doc1, doc2 = (c.args[0] for c in build.call_args_list)
+        # Passed as json, so each Connection gets its own parsed document:
+        assert isinstance(doc1, str)
+        assert doc1 == doc2
+
+    def test_that_batch_mode_holds_requests_until_it_closes(
+        self, mocker: MockerFixture
+    ):
+        mocker.patch.object(Connection, "_authenticate")
+        mocker.patch("autodrive._conn.build_from_document")
+        conn = SheetsConnection(auth_config=AuthConfig())
+        batch_update = conn._sheets.batchUpdate
+        request1 = {"addSheet": {"properties": {"title": "a"}}}
+        request2 = {"addSheet": {"properties": {"title": "b"}}}
+        with conn.batch_mode():
+            assert conn.execute_requests("sheet1", [request1]) == {}
+            conn.execute_requests("sheet2", [request1])
+            conn.execute_requests("sheet1", [request2])
+            batch_update.assert_not_called()
+        assert batch_update.call_count == 2
+        batch_update.assert_any_call(
+            spreadsheetId="sheet1", body={"requests": [request1, request2]}
+        )
+        batch_update.assert_any_call(
+            spreadsheetId="sheet2", body={"requests": [request1]}
+        )
+        conn.execute_requests("sheet1", [request1])
+        assert batch_update.call_count == 3
+
+    def test_that_nested_batch_mode_only_sends_at_the_outermost_exit(
+        self, mocker: MockerFixture
+    ):
+        mocker.patch.object(Connection, "_authenticate")
+        mocker.patch("autodrive._conn.build_from_document")
+        conn = SheetsConnection(auth_config=AuthConfig())
+        batch_update = conn._sheets.batchUpdate
+        request1 = {"addSheet": {"properties": {"title": "a"}}}
+        request2 = {"addSheet": {"properties": {"title": "b"}}}
+        with conn.batch_mode():
+            conn.execute_requests("sheet1", [request1])
+            with conn.batch_mode():
+                conn.execute_requests("sheet1", [request2])
+            batch_update.assert_not_called()
+            assert conn.execute_requests("sheet1", [request1]) == {}
+        batch_update.assert_called_once_with(
+            spreadsheetId="sheet1", body={"requests": [request1, request2, request1]}
+        )
+        with pytest.raises(ValueError):
+            with conn.batch_mode():
+                conn.execute_requests("sheet1", [request1])
+                with conn.batch_mode():
+                    raise ValueError()
+        assert batch_update.call_count == 1
+        conn.execute_requests("sheet1", [request1])
+        assert batch_update.call_count == 2
+
+    def test_that_find_objects_ignores_unrequested_names(self, mocker: MockerFixture):
+        mocker.patch.object(Connection, "_authenticate")
+        mocker.patch("autodrive._conn.build_from_document")
+        conn = DriveConnection(auth_config=AuthConfig())
+        mocker.patch.object(
+            conn,
+            "_list_objects",
+            return_value=[{"name": "a", "id": "1"}, {"name": "A", "id": "2"}],
+        )
+        result = conn.find_objects(("a", "sheet"), ("b", "folder"))
+        assert result == {"a": [{"name": "a", "id": "1"}], "b": []}
+
+    def test_that_batch_mode_keeps_commits_in_order(self, mocker: MockerFixture):
+        mocker.patch.object(Connection, "_authenticate")
+        mocker.patch("autodrive._conn.build_from_document")
+        conn = SheetsConnection(auth_config=AuthConfig())
+        batch_update = conn._sheets.batchUpdate
+        tab = Tab("sheet1", "Sheet1", 0, 0, sheets_conn=conn)
+        with conn.batch_mode():
+            tab.write_values([[1, 2]])
+            tab.commit()
+            tab.write_values([[3, 4]], mode="a")
+            tab.commit()
+        requests = batch_update.call_args.kwargs["body"]["requests"]
+        assert [list(r.keys())[0] for r in requests] == ["updateCells", "appendCells"]
+        with conn.batch_mode():
+            tab.write_values([[1, 2]])
+            tab.commit()
+            tab.write_values([[3, 4]], mode="a")
+            tab.commit_and_fetch()
+        requests = batch_update.call_args.kwargs["body"]["requests"]
+        assert [list(r.keys())[0] for r in requests] == ["updateCells", "appendCells"]
+
     def test_merge_dicts(self):
         expected = {"a": 1, "b": [1, 2, 3], "c": {"d": [1, 2, 3], "e": {"f": 100}}}
         dict1 = {"a": 2, "c": {"e": {"f": 100}}}
         dict2 = {"a": 1, "b": [1, 2, 3], "c": {"d": [1, 2, 3], "e": {"f": 100}}}
         assert Connection._merge_dicts(dict1, dict2) == expected
 
+    def test_merge_fields(self):
+        assert Connection._merge_fields(None, "a") == "a"
+        assert Connection._merge_fields("a", "*") == "*"
+        assert Connection._merge_fields("a,b(c, d)", "b(c, d),e") == "a,b(c, d),e"
+        assert (
+            Connection._merge_fields("userEnteredFormat(textFormat(bold)),a", "x")
+            == "userEnteredFormat(textFormat(bold)),a,x"
+        )
+
+    def test_that_preprocess_requests_only_merges_colliding_ranges(self):
+        rng = {"sheetId": 0, "startIndex": 0, "endIndex": 5}
+        request1 = {"repeatCell": {"range": rng, "fields": "a", "cell": {"a": 1}}}
+        request2 = {"repeatCell": {"range": rng, "fields": "b", "cell": {"b": 2}}}
+        result = Connection._preprocess_requests([request1])
+        assert result["requests"][0] is request1
+        result = Connection._preprocess_requests([request1, request2])
+        assert result["requests"] == [
+            {"repeatCell": {"range": rng, "fields": "a,b", "cell": {"a": 1, "b": 2}}}
+        ]
+        assert request1["repeatCell"]["fields"] == "a"
+        assert request1["repeatCell"]["cell"] == {"a": 1}
+
     def test_create_range_tuple_key(self):
         expected = (("sheetId", 0), ("startIndex", 1), ("endIndex", 5))
         result = Connection._create_range_tuple_key(
@@ -160,3 +309,41 @@ class TestConnection:
         }
         result = Connection._preprocess_requests(requests)
         assert result == expected
+
+    def test_that_preprocess_requests_merges_field_masks(self):
+        rng = {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 5}
+        requests = [
+            {
+                "repeatCell": {
+                    "range": rng,
+                    "fields": "userEnteredFormat.textFormat",
+                    "cell": {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                }
+            },
+            {
+                "repeatCell": {
+                    "range": rng,
+                    "fields": "userEnteredFormat.numberFormat",
+                    "cell": {"userEnteredFormat": {"numberFormat": {"type": "NUMBER"}}},
+                }
+            },
+        ]
+        result = Connection._preprocess_requests(requests)
+        assert result == {
+            "requests": [
+                {
+                    "repeatCell": {
+                        "range": rng,
+                        "fields": (
+                            "userEnteredFormat.textFormat,userEnteredFormat.numberFormat"
+                        ),
+                        "cell": {
+                            "userEnteredFormat": {
+                                "textFormat": {"bold": True},
+                                "numberFormat": {"type": "NUMBER"},
+                            }
+                        },
+                    }
+                }
+            ]
+        }
@@ -1,4 +1,3 @@
-from datetime import datetime as dt
 from pathlib import Path
 
 import pytest
@@ -11,17 +10,18 @@ from . import testing_tools
 class TestDriveConnection:
     class TestObjectCreationAndMetadataChanges:
         def test_create_folder_and_add_sheet_to_it(self, drive_conn: DriveConnection):
-            folder = f"autodrive_test_folder {dt.now()}"
+            folder = testing_tools.unique_name("autodrive_test_folder")
             f_id = drive_conn.create_object(folder, "folder")
-            testing_tools.CREATED_IDS.insert(0, f_id)
-            f = drive_conn.find_object(folder, "folder")
-            assert len(f) > 0
-            assert f[0].get("name") == folder
+            testing_tools.CREATED_IDS.append((f_id, None))
             # Add a sheet
-            sheet = f"autodrive_test_sheet_in_folder {dt.now()}"
+            sheet = testing_tools.unique_name("autodrive_test_sheet_in_folder")
             sf_id = drive_conn.create_object(sheet, "sheet", f_id)
-            testing_tools.CREATED_IDS.insert(0, sf_id)
-            f = drive_conn.find_object(sheet, "sheet")
+            testing_tools.CREATED_IDS.append((sf_id, f_id))
+            found = drive_conn.find_objects((folder, "folder"), (sheet, "sheet"))
+            f = found[folder]
+            assert len(f) > 0
+            assert f[0].get("name") == folder
+            f = found[sheet]
             assert len(f) > 0
             assert f[0].get("name") == sheet
             assert f[0]["parents"][0] == f_id
@@ -32,26 +32,29 @@ class TestDriveConnection:
             fileB = samples.joinpath("textfileB.txt")
             fileC = samples.joinpath("textfileC.txt")
             f_id1 = drive_conn.create_object(
-                f"autodrive_test_folder {dt.now()}", "folder"
+                testing_tools.unique_name("autodrive_test_folder"), "folder"
             )
             f_id2 = drive_conn.create_object(
-                f"autodrive_test_folder {dt.now()}", "folder"
+                testing_tools.unique_name("autodrive_test_folder"), "folder"
             )
-            testing_tools.CREATED_IDS.insert(0, f_id1)
-            testing_tools.CREATED_IDS.insert(0, f_id2)
-            file_b_name = f"{fileB.name}_{dt.now()}"
+            testing_tools.CREATED_IDS.append((f_id1, None))
+            testing_tools.CREATED_IDS.append((f_id2, None))
+            file_b_name = testing_tools.unique_name(fileB.name)
             result = drive_conn.upload_files(
                 str(fileA),
                 FileUpload(fileB, f_id1, name_override=file_b_name),
                 FileUpload(str(fileC), f_id2, convert=True),
             )
-            testing_tools.CREATED_IDS.insert(0, result[fileA.name])
-            testing_tools.CREATED_IDS.insert(0, result[fileB.name])
-            testing_tools.CREATED_IDS.insert(0, result[fileC.name])
-            fA = drive_conn.find_object(fileA.name, "file")
+            testing_tools.CREATED_IDS.append((result[fileA.name], None))
+            testing_tools.CREATED_IDS.append((result[fileB.name], f_id1))
+            testing_tools.CREATED_IDS.append((result[fileC.name], f_id2))
+            found = drive_conn.find_objects(
+                (fileA.name, "file"), (file_b_name, "file"), (fileC.stem, "file")
+            )
+            fA = found[fileA.name]
             assert len(fA) > 0
             assert fA[0].get("name") == fileA.name
-            fB = drive_conn.find_object(file_b_name, "file")
+            fB = found[file_b_name]
             assert len(fB) > 0
             assert fB[0].get("name") == file_b_name
             fB_parents = fB[0].get("parents")
@@ -66,7 +69,18 @@ class TestDriveConnection:
                     f"f_id1 = {f_id1}, f_id2 = {f_id2}. Drive ID = {gdrive_id}. "
                     f"Length of fileB find_object results = {len(fB)}."
                 )
-            fC = drive_conn.find_object(fileC.stem, "file")
+            fC = found[fileC.stem]
             assert len(fC) > 0
             assert fC[0].get("name") == fileC.stem
             assert fC[0].get("parents") == [f_id2]
+
+        def test_delete_objects(self, drive_conn: DriveConnection):
+            folder = testing_tools.unique_name("autodrive_test_folder")
+            f_id1 = drive_conn.create_object(folder, "folder")
+            f_id2 = drive_conn.create_object(folder, "folder")
+            # Cleaned up at the end of the session if delete_objects fails:
+            testing_tools.CREATED_IDS.append((f_id1, None))
+            testing_tools.CREATED_IDS.append((f_id2, None))
+            failed = drive_conn.delete_objects(f_id1, f_id2, f_id1)
+            assert failed == {}
+            assert drive_conn.find_object(folder, "folder") == []
@@ -11,18 +11,14 @@ from autodrive.connection import SheetsConnection
 
 @pytest.mark.connection
 class TestCRUD:
-    @pytest.fixture
-    def input_data(self):
-        return [[1, 2, 3], [4, 5, 6]]
-
     def test_that_gsheet_can_write_and_read_values(
-        self, test_gsheet: GSheet, input_data: List[List[int]]
+        self, fetched_gsheet: GSheet, input_data: List[List[int]]
     ):
-        test_gsheet.write_values(input_data)
-        test_gsheet.commit()
-        test_gsheet.get_data()
-        test_gsheet.tabs
-        assert test_gsheet[0].values == input_data
+        fetched_gsheet.write_values(input_data)
+        fetched_gsheet.commit()
+        fetched_gsheet.get_data()
+        fetched_gsheet.tabs
+        assert fetched_gsheet[0].values == input_data
 
     def test_that_range_can_write_and_read_values(
         self,
@@ -38,24 +34,13 @@ class TestCRUD:
             sheets_conn=sheets_conn,
         )
         rng.write_values(input_data)
-        rng.commit()
-        rng.get_data()
+        rng.commit_and_fetch()
         assert rng.values == input_data
 
     def test_that_tab_can_write_and_append_and_read_values(
-        self,
-        test_gsheet: GSheet,
-        sheets_conn: SheetsConnection,
-        input_data: List[List[int]],
+        self, shared_test_tab: Tab, input_data: List[List[int]]
     ):
-        tab = Tab(
-            test_gsheet.gsheet_id,
-            tab_title="test_sheet",
-            tab_idx=1,
-            tab_id=123456789,
-            sheets_conn=sheets_conn,
-        )
-        tab.create()
+        tab = shared_test_tab
         tab.write_values(input_data)
         tab.commit()
         tab.get_data()
@@ -1,6 +1,10 @@
-# import pytest
+import pytest
+from pytest_mock import MockerFixture
 
+from autodrive.connection import SheetsConnection
+from autodrive.dtypes import EffectiveVal
 from autodrive.gsheet import GSheet, Tab
+from autodrive.range import Range
 
 # from autodrive.connection import SheetsConnection
 
@@ -18,6 +22,104 @@ class TestGSheet:
         assert gsheet["Sheet1"]
         assert gsheet[0]
 
+    def test_that_it_can_add_tabs_in_bulk(self):
+        gsheet = GSheet(
+            "test",
+            tabs=[Tab("test", "Sheet1", 0, 0, autoconnect=False)],
+            autoconnect=False,
+        )
+        gsheet.add_tabs(
+            Tab("test", "Sheet2", 1, 1, autoconnect=False),
+            Tab("test", "Sheet3", 2, 2, autoconnect=False),
+        )
+        assert list(gsheet.tabs.keys()) == ["Sheet1", "Sheet2", "Sheet3"]
+        assert [r["addSheet"]["properties"]["title"] for r in gsheet.requests] == [
+            "Sheet2",
+            "Sheet3",
+        ]
+        with pytest.raises(ValueError, match="Sheet4"):
+            gsheet.add_tabs(
+                Tab("test", "Sheet4", 3, 3, autoconnect=False),
+                Tab("test", "Sheet4", 4, 4, autoconnect=False),
+            )
+        assert len(gsheet.requests) == 2
+
+    def test_that_it_can_refresh_components_in_one_request(self, mocker: MockerFixture):
+        conn = mocker.Mock(spec=SheetsConnection)
+        conn.get_data.return_value = {
+            "sheets": [
+                {
+                    "properties": {"title": "Sheet1"},
+                    "data": [
+                        {
+                            "rowData": [
+                                {"values": [{"effectiveValue": {"numberValue": 1}}]}
+                            ]
+                        },
+                        {
+                            "rowData": [
+                                {"values": [{"effectiveValue": {"numberValue": 2}}]}
+                            ]
+                        },
+                    ],
+                },
+                {
+                    "properties": {"title": "Sheet2"},
+                    "data": [
+                        {
+                            "rowData": [
+                                {"values": [{"effectiveValue": {"numberValue": 3}}]}
+                            ]
+                        }
+                    ],
+                },
+            ]
+        }
+        tab2 = Tab(
+            "test", "Sheet2", 1, 1, column_count=1, row_count=1, sheets_conn=conn
+        )
+        rng1 = Range("A1", "test", "Sheet1", 0, sheets_conn=conn)
+        rng2 = Range("B2", "test", "Sheet1", 0, sheets_conn=conn)
+        gsheet = GSheet("test", sheets_conn=conn)
+        gsheet.refresh(rng1, tab2, rng2)
+        conn.get_data.assert_called_once_with(
+            "test",
+            ["Sheet1!A1", "Sheet2!A1:B2", "Sheet1!B2"],
+            with_tab_titles=True,
+            value_type=EffectiveVal,
+        )
+        assert rng1.values == [[1]]
+        assert rng2.values == [[2]]
+        assert tab2.values == [[3]]
+
+    def test_that_it_refreshes_untitled_ranges_from_the_first_tab(
+        self, mocker: MockerFixture
+    ):
+        conn = mocker.Mock(spec=SheetsConnection)
+        conn.get_data.return_value = {
+            "sheets": [
+                {
+                    "properties": {"title": "Sheet1"},
+                    "data": [
+                        {
+                            "rowData": [
+                                {"values": [{"effectiveValue": {"numberValue": 1}}]}
+                            ]
+                        }
+                    ],
+                }
+            ]
+        }
+        rng = Range("A1", "test", "", 0, sheets_conn=conn)
+        gsheet = GSheet("test", sheets_conn=conn)
+        with pytest.raises(ValueError, match="without a tab title"):
+            gsheet.refresh(rng)
+        conn.get_data.assert_not_called()
+        tab = Tab("test", "Sheet1", 0, 0, column_count=1, row_count=1, sheets_conn=conn)
+        gsheet = GSheet("test", sheets_conn=conn, tabs=[tab])
+        gsheet.refresh(rng)
+        assert rng.values == [[1]]
+
     # @pytest.mark.skip
     # def test_that_it_can_add_tabs_requests(self, sheets_conn: SheetsConnection):
     #     expected = [
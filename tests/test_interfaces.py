@@ -23,11 +23,27 @@ class TestRangeInterface:
         assert _RangeInterface._parse_range_str("A1:A") == (None, "A1", "A")
         assert _RangeInterface._parse_range_str("A1") == (None, "A1", None)
         assert _RangeInterface._parse_range_str("A10:L10") == (None, "A10", "L10")
+        assert _RangeInterface._parse_range_str("'My Sheet'!A1:C5") == (
+            "My Sheet",
+            "A1",
+            "C5",
+        )
+        assert _RangeInterface._parse_range_str("'Bob''s Sheet'!A1") == (
+            "Bob's Sheet",
+            "A1",
+            None,
+        )
         with pytest.raises(  # type: ignore
             ParseRangeError, match="parb is not a valid range."
         ):
             _RangeInterface._parse_range_str("parb")
 
+    def test_that_it_can_add_tab_titles(self):
+        assert _RangeInterface._add_tab_title("A1:C5") == "A1:C5"
+        assert _RangeInterface._add_tab_title("A1:C5", "Sheet1") == "Sheet1!A1:C5"
+        assert _RangeInterface._add_tab_title("A1", "My Sheet") == "'My Sheet'!A1"
+        assert _RangeInterface._add_tab_title("A1", "Bob's") == "'Bob''s'!A1"
+
     def test_that_it_can_parse_cell_strings(self):
         assert _RangeInterface._parse_cell_str("A1") == ("A", "1")
         assert _RangeInterface._parse_cell_str("A") == ("A", None)
@@ -252,9 +268,20 @@ class TestFullRange:
         assert result.end_row == 9
         assert result.start_col == 0
         assert result.end_col == 11
+        result = FullRange("A1:B1")
+        assert result.end_row == 0
+        assert str(result) == "A1:B1"
         with pytest.raises(ParseRangeError):  # type: ignore
             FullRange("D:D50")
 
+    def test_that_repeated_range_strs_are_only_parsed_once(self):
+        FullRange._parse_full_range_str.cache_clear()
+        FullRange("Sheet1!B2:C3")
+        result = FullRange("Sheet1!B2:C3", tab_title="Sheet2")
+        assert FullRange._parse_full_range_str.cache_info().hits == 1
+        assert result.tab_title == "Sheet2"
+        assert str(result) == "Sheet2!B2:C3"
+
 
 class TestColor:
     def test_that_it_can_be_instantiated_from_hex_code(self):
@@ -291,10 +318,10 @@ class TestColor:
 
 
 @pytest.mark.connection
-def test_that_all_numeric_formats_work_as_expected(test_gsheet: GSheet):
+def test_that_all_numeric_formats_work_as_expected(fetched_gsheet: GSheet):
     # This is partially to act as a safeguard against google changing the
     # pattern representations of these formats, so think twice before deleting:
-    tab = test_gsheet.tabs["Sheet1"]
+    tab = fetched_gsheet.tabs["Sheet1"]
     rng = FullRange("A10:L10")
     tab.write_values([[1234.56 for _ in range(12)]], rng)
     formats = [
@@ -0,0 +1,43 @@
+from pytest_mock import MockerFixture
+
+from autodrive.connection import SheetsConnection
+from autodrive.dtypes import EffectiveVal
+from autodrive.range import Range
+
+
+class TestRange:
+    def test_that_it_can_commit_and_fetch_in_one_request(self, mocker: MockerFixture):
+        conn = mocker.Mock(spec=SheetsConnection)
+        conn.execute_requests_and_get_data.return_value = {
+            "replies": [{}],
+            "updatedSpreadsheet": {
+                "sheets": [
+                    {
+                        "data": [
+                            {
+                                "rowData": [
+                                    {
+                                        "values": [
+                                            {"effectiveValue": {"numberValue": 1}},
+                                            {"effectiveValue": {"stringValue": "a"}},
+                                        ]
+                                    },
+                                    {"values": [{}, {}]},
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            },
+        }
+        rng = Range("A1:B2", "test", "Sheet1", 0, sheets_conn=conn)
+        rng.write_values([[1, "a"]])
+        requests = rng.requests
+        rng.commit_and_fetch()
+        conn.execute_requests_and_get_data.assert_called_once_with(
+            "test", requests, ["Sheet1!A1:B2"], EffectiveVal
+        )
+        conn.get_data.assert_not_called()
+        assert rng.requests == []
+        assert rng.values == [[1, "a"], [None, None]]
+        assert rng.formats == [[{}, {}], [{}, {}]]
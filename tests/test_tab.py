@@ -1,3 +1,7 @@
+from pytest_mock import MockerFixture
+
+from autodrive.connection import SheetsConnection
+from autodrive.dtypes import EffectiveVal
 from autodrive.tab import Tab
 
 
@@ -27,3 +31,31 @@ class TestTab:
                 }
             }
         }
+
+    def test_that_it_can_commit_and_fetch_in_one_request(self, mocker: MockerFixture):
+        conn = mocker.Mock(spec=SheetsConnection)
+        conn.execute_requests_and_get_data.return_value = {
+            "replies": [{}],
+            "updatedSpreadsheet": {
+                "sheets": [
+                    {
+                        "data": [
+                            {
+                                "rowData": [
+                                    {"values": [{"effectiveValue": {"numberValue": 1}}]}
+                                ]
+                            }
+                        ]
+                    }
+                ]
+            },
+        }
+        tab = Tab("test", "Sheet1", 0, 0, 1, 1, sheets_conn=conn)
+        tab.write_values([[1]])
+        requests = tab.requests
+        tab.commit_and_fetch()
+        conn.execute_requests_and_get_data.assert_called_once_with(
+            "test", requests, ["Sheet1!A1:B2"], EffectiveVal
+        )
+        assert tab.requests == []
+        assert tab.values == [[1]]
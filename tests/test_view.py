@@ -1,12 +1,57 @@
 from typing import List, Dict, Any
 import string
 
+import pytest
+
 from autodrive.dtypes import FormattedVal, UserEnteredVal, EffectiveVal
 from autodrive._view import GSheetView
-from autodrive.interfaces import FullRange
 from autodrive.range import Range
 from .samples.data import ExampleView
 
+_ALPHA = list(string.ascii_uppercase)
+
+_FMT1 = {"col_rangeAlignment": "left"}
+_FMT2 = {"textFormat": {"bold": True}}
+_FMT3 = {"backGroundColor": {"red": 0.5, "green": 0, "blue": 0.5}}
+_RAW_ROW_DATA: List[Dict[str, List[Dict[str, Any]]]] = [
+    dict(
+        values=[
+            {},
+            {},
+            {
+                "formattedValue": "test",
+                "userEnteredValue": {"stringValue": "test"},
+                "effectiveValue": {"stringValue": "test"},
+                "effectiveFormat": _FMT1,
+            },
+        ]
+    ),
+    dict(
+        values=[
+            {},
+            {
+                "formattedValue": "1",
+                "userEnteredValue": {"numberValue": "1"},
+                "effectiveValue": {"numberValue": 1},
+                "effectiveFormat": _FMT2,
+            },
+            {},
+        ]
+    ),
+    dict(
+        values=[
+            {
+                "formattedValue": "3",
+                "userEnteredValue": {"formulaValue": "=A1+A2"},
+                "effectiveValue": {"numberValue": 3},
+                "effectiveFormat": _FMT3,
+            }
+        ]
+    ),
+    dict(values=[{}, {}]),
+]
+_EXPECTED_ROW_FORMATS = [[{}, {}, _FMT1], [{}, _FMT2, {}], [_FMT3], [{}, {}]]
+
 
 class TestGSheetView:
     def test_that_it_can_parse_properties(self):
@@ -26,71 +71,60 @@ class TestGSheetView:
         }
         assert GSheetView._parse_properties(raw) == expected
 
-    def test_that_it_can_parse_row_data(self):
-        fmt1 = {"col_rangeAlignment": "left"}
-        value1 = {
-            "formattedValue": "test",
-            "userEnteredValue": {"stringValue": "test"},
-            "effectiveValue": {"stringValue": "test"},
-            "effectiveFormat": fmt1,
-        }
-        fmt2 = {"textFormat": {"bold": True}}
-        value2 = {
-            "formattedValue": "1",
-            "userEnteredValue": {"numberValue": "1"},
-            "effectiveValue": {"numberValue": 1},
-            "effectiveFormat": fmt2,
-        }
-        fmt3 = {"backGroundColor": {"red": 0.5, "green": 0, "blue": 0.5}}
-        value3 = {
-            "formattedValue": "3",
-            "userEnteredValue": {"formulaValue": "=A1+A2"},
-            "effectiveValue": {"numberValue": 3},
-            "effectiveFormat": fmt3,
-        }
+    @pytest.mark.parametrize(
+        "value_type,expected_values",
+        [
+            (
+                UserEnteredVal,
+                [[None, None, "test"], [None, 1, None], ["=A1+A2"], [None, None]],
+            ),
+            (EffectiveVal, [[None, None, "test"], [None, 1, None], [3], [None, None]]),
+            (
+                FormattedVal,
+                [[None, None, "test"], [None, "1", None], ["3"], [None, None]],
+            ),
+        ],
+    )
+    def test_that_it_can_parse_row_data(
+        self, value_type: Any, expected_values: List[List[Any]]
+    ):
+        values, formats = GSheetView._parse_row_data(
+            _RAW_ROW_DATA, value_type=value_type
+        )
+        assert values == expected_values
+        assert formats == _EXPECTED_ROW_FORMATS
+
+    def test_that_it_can_parse_falsy_and_error_values(self):
         raw: List[Dict[str, List[Dict[str, Any]]]] = [
-            dict(values=[{}, {}, value1]),
-            dict(values=[{}, value2, {}]),
-            dict(values=[value3]),
+            dict(
+                values=[
+                    {"effectiveValue": {"numberValue": 0}},
+                    {"effectiveValue": {"boolValue": False}},
+                    {"effectiveValue": {"errorValue": {"type": "DIVIDE_BY_ZERO"}}},
+                ]
+            ),
         ]
-        expected_values = [[None, None, "test"], [None, 1, None], ["=A1+A2"]]
-        expected_formats = [[{}, {}, fmt1], [{}, fmt2, {}], [fmt3]]
-        values, formats = GSheetView._parse_row_data(raw, value_type=UserEnteredVal)
-        assert values == expected_values
-        assert formats == expected_formats
-        expected_values = [[None, None, "test"], [None, 1, None], [3]]
-        values, formats = GSheetView._parse_row_data(raw, value_type=EffectiveVal)
-        assert values == expected_values
-        expected_values = [[None, None, "test"], [None, "1", None], ["3"]]
-        values, formats = GSheetView._parse_row_data(raw, value_type=FormattedVal)
-        assert values == expected_values
+        values, _ = GSheetView._parse_row_data(raw, value_type=EffectiveVal)
+        assert values == [[0, False, None]]
 
-    def test_that_it_can_gen_cell_write_value(self):
-        assert GSheetView._gen_cell_write_value(1) == {
-            "userEnteredValue": {"numberValue": 1}
-        }
-        assert GSheetView._gen_cell_write_value(1.123) == {
-            "userEnteredValue": {"numberValue": 1.123}
-        }
-        assert GSheetView._gen_cell_write_value([1, 2, 3]) == {
-            "userEnteredValue": {"stringValue": [1, 2, 3]}
-        }
-        assert GSheetView._gen_cell_write_value(True) == {
-            "userEnteredValue": {"boolValue": True}
-        }
-        assert GSheetView._gen_cell_write_value("=A1+B2") == {
-            "userEnteredValue": {"formulaValue": "=A1+B2"}
-        }
+    @pytest.mark.parametrize(
+        "python_val,expected",
+        [
+            (1, {"userEnteredValue": {"numberValue": 1}}),
+            (1.123, {"userEnteredValue": {"numberValue": 1.123}}),
+            ([1, 2, 3], {"userEnteredValue": {"stringValue": [1, 2, 3]}}),
+            (True, {"userEnteredValue": {"boolValue": True}}),
+            ("=A1+B2", {"userEnteredValue": {"formulaValue": "=A1+B2"}}),
+        ],
+    )
+    def test_that_it_can_gen_cell_write_value(
+        self, python_val: Any, expected: Dict[str, Any]
+    ):
+        assert GSheetView._gen_cell_write_value(python_val) == expected
 
-    def test_that_it_can_create_write_values_requests(self):
+    def test_that_it_can_create_write_values_requests(self, a1c3_range: Range):
         comp = ExampleView(gsheet_id="test")
-        rng = Range(
-            FullRange("Sheet1!A1:C3"),
-            tab_title="",
-            tab_id=0,
-            gsheet_id="test",
-            autoconnect=False,
-        )
+        rng = a1c3_range
         data1: List[List[Any]] = [["a", "b", "c"], [1, 2, 3], [4, 5, 6]]
         comp._write_values(data1, 0, rng.range.to_dict())
         str_w_vals = [{"userEnteredValue": {"stringValue": v}} for v in data1[0]]
@@ -121,7 +155,31 @@ class TestGSheetView:
         comp._write_values(data2, 0, rng.range.to_dict())
         assert comp.requests == expected
 
-    def test_that_it_can_gen_alpha_keys(self):
-        assert GSheetView.gen_alpha_keys(5) == [*string.ascii_uppercase[:5]]
-        expected = [*string.ascii_uppercase, "AA", "AB"]
-        assert GSheetView.gen_alpha_keys(28) == expected
+    def test_that_it_converts_array_likes_before_writing(self):
+        class ArrayLike:
+            def tolist(self) -> List[List[Any]]:
+                return [[1, 2]]
+
+        comp = ExampleView(gsheet_id="test", autoconnect=False)
+        comp._write_values(ArrayLike(), 0)  # type: ignore
+        assert comp.requests[0]["appendCells"]["rows"] == [
+            {
+                "values": [
+                    {"userEnteredValue": {"numberValue": 1}},
+                    {"userEnteredValue": {"numberValue": 2}},
+                ]
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "num,expected",
+        [
+            (5, _ALPHA[:5]),
+            (26, _ALPHA),
+            (28, [*_ALPHA, "AA", "AB"]),
+            (702, [*_ALPHA, *[a + b for a in _ALPHA for b in _ALPHA]]),
+            (703, [*_ALPHA, *[a + b for a in _ALPHA for b in _ALPHA], "AAA"]),
+        ],
+    )
+    def test_that_it_can_gen_alpha_keys(self, num: int, expected: List[str]):
+        assert GSheetView.gen_alpha_keys(num) == expected
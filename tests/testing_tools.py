@@ -1,3 +1,101 @@
-from typing import List
+from __future__ import annotations
 
-CREATED_IDS: List[str] = []
+import os
+import threading
+import time
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from googleapiclient.errors import HttpError
+
+from autodrive.connection import DriveConnection
+
+# (object id, parent folder id) for every object the tests create:
+CREATED_IDS: List[Tuple[str, str | None]] = []
+# How many times an api call is retried (with exponential backoff) after being
+# rate limited by the Google apis, enough to outlast the per-minute quotas:
+RATE_LIMIT_RETRIES = 6
+# Lets CI throttle how many deletes are retried at once:
+DELETE_WORKERS = int(os.environ.get("AUTODRIVE_TEST_DELETE_WORKERS", 8))
+
+
+def unique_name(prefix: str) -> str:
+    """
+    Generates a Google Drive object name that won't collide with those from other
+    tests, test runs, or pytest-xdist workers.
+
+    Args:
+        prefix (str): The start of the name.
+
+    Returns:
+        str: The prefix followed by a random suffix.
+
+    """
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
+
+def retry_after(e: HttpError, default: float = 1) -> float:
+    """
+    Args:
+        e (HttpError): A rate limiting error from a Google api.
+        default (float, optional): The number of seconds to wait if the api
+            didn't say, defaults to 1.
+
+    Returns:
+        float: The number of seconds the api asked to wait before retrying.
+
+    """
+    return float(e.resp.get("retry-after", default))
+
+
+def delete_created_ids(conn: DriveConnection) -> None:
+    """
+    Deletes every object in CREATED_IDS from Google Drive in batched requests,
+    retrying any that were rate limited on a bounded thread pool. Objects that
+    are still rate limited after RATE_LIMIT_RETRIES attempts are left behind with
+    a warning.
+
+    Args:
+        conn (DriveConnection): The connection the objects were created with.
+
+    """
+    local = threading.local()
+
+    def safe_delete(object_id: str, wait: float) -> None:
+        # httplib2 connections aren't thread-safe, so each worker needs its own:
+        if not hasattr(local, "conn"):
+            local.conn = DriveConnection(auth_config=conn.auth)
+        for _ in range(RATE_LIMIT_RETRIES):
+            time.sleep(wait)
+            try:
+                local.conn.delete_object(object_id)
+                return
+            except HttpError as e:
+                if e.resp.status == 404:
+                    return
+                elif e.resp.status == 429:
+                    wait = retry_after(e)
+                else:
+                    raise
+        warnings.warn(
+            f"Gave up deleting {object_id} after {RATE_LIMIT_RETRIES} rate limited "
+            "retries, it will have to be deleted manually."
+        )
+
+    # Deleting a folder also deletes everything in it, so only the objects whose
+    # parent isn't being deleted need their own delete call:
+    created = {object_id for object_id, _ in CREATED_IDS}
+    ids = [object_id for object_id, parent in CREATED_IDS if parent not in created]
+    CREATED_IDS.clear()
+    rate_limited = {}
+    for object_id, e in conn.delete_objects(*ids).items():
+        if e.resp.status == 429:
+            rate_limited[object_id] = retry_after(e)
+        elif e.resp.status != 404:
+            raise e
+    if rate_limited:
+        workers = max(1, min(DELETE_WORKERS, len(rate_limited)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(safe_delete, rate_limited.keys(), rate_limited.values()))